@@ -0,0 +1,19 @@
+"""
+Redis 캐시 클라이언트 모듈
+
+Redis 연결 풀과 클라이언트를 모듈 임포트 시 한 번만 생성합니다.
+REDIS_URL 환경 변수가 설정되지 않은 경우 redis_client는 None이며,
+캐시를 사용하는 코드는 DB 조회로 대체합니다.
+"""
+
+import redis
+
+from app.config import settings
+
+redis_client: redis.Redis | None = None
+
+if settings.REDIS_URL:
+    redis_pool = redis.ConnectionPool.from_url(
+        settings.REDIS_URL, decode_responses=True
+    )
+    redis_client = redis.Redis(connection_pool=redis_pool)
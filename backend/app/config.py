@@ -2,28 +2,78 @@
 애플리케이션 설정 관리 모듈
 
 환경 변수 또는 기본값을 사용하여 설정을 관리합니다.
+설정은 get_settings()로 최초 1회만 읽어 캐시하며,
+ENV=prod인 경우 .env 파일을 읽지 않습니다.
 """
 
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
 
-# .env 파일 로드
-load_dotenv()
+from dotenv import load_dotenv
 
 
 class Settings:
-    """애플리케이션 설정 클래스"""
+    """
+    애플리케이션 설정 클래스
+
+    인스턴스 생성 시점에 환경 변수를 읽습니다.
+    직접 생성하기보다 get_settings()를 통해 캐시된 인스턴스를 사용합니다.
+    """
+
+    def __init__(self):
+        # JWT 설정
+        self.SECRET_KEY: str = os.getenv(
+            "SECRET_KEY",
+            "your-secret-key-here-change-this-in-production"
+        )
+        self.ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
+        self.ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
+            os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+        )
+
+        # 비밀번호 해싱 설정 (bcrypt cost, 1 감소당 해싱 시간 약 절반)
+        self.BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+        # 개발 모드 설정
+        self.DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+        # DEBUG 모드에서 요청당 쿼리 수가 이 값을 넘으면 경고 로그 출력
+        self.QUERY_COUNT_WARN_THRESHOLD: int = int(
+            os.getenv("QUERY_COUNT_WARN_THRESHOLD", "10")
+        )
+
+        # 데이터베이스 설정
+        self.DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+        self.DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+        self.DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_RECYCLE_SECONDS: int = int(
+            os.getenv("DB_POOL_RECYCLE_SECONDS", "1800")
+        )
+
+        # Redis 캐시 설정 (REDIS_URL 미설정 시 캐시 비활성화)
+        self.REDIS_URL: str | None = os.getenv("REDIS_URL")
+        self.USER_CACHE_TTL_SECONDS: int = int(
+            os.getenv("USER_CACHE_TTL_SECONDS", "60")
+        )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    캐시된 설정 인스턴스 반환
+
+    첫 호출 시에만 .env 로드(ENV=prod 제외)와 환경 변수 파싱을 수행합니다.
+    get_settings.cache_clear() 후 호출하면 환경 변수를 다시 읽지만,
+    임포트 시점에 모듈 수준 settings를 사용한 모듈(database, cache,
+    utils.auth 등)에는 반영되지 않습니다.
 
-    # JWT 설정
-    SECRET_KEY: str = os.getenv(
-        "SECRET_KEY",
-        "your-secret-key-here-change-this-in-production"
-    )
-    ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
-        os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
-    )
+    Returns:
+        Settings 인스턴스
+    """
+    if os.getenv("ENV") != "prod":
+        # .env 파일 로드
+        load_dotenv()
+    return Settings()
 
 
 # 설정 인스턴스 (싱글톤)
-settings = Settings()
+settings = get_settings()
@@ -2,15 +2,25 @@ from app.crud.user import (
     create_user,
     get_user_by_email,
     get_user_by_id,
+    get_user_auth_stub,
     get_user_by_username,
+    get_users_by_email_or_username,
+    invalidate_user_cache,
 )
 from app.crud.activity import (
     create_activity,
+    create_activities,
     get_activities_by_user,
     get_activity_by_id,
     get_activities_by_type,
     get_activity_stats,
+    clear_activity_stats_cache,
+    delete_activity,
+    activity_exists,
     delete_old_activities,
+    enqueue_activity,
+    ActivityWriteBuffer,
+    activity_write_buffer,
 )
 
 __all__ = [
@@ -18,12 +28,22 @@ __all__ = [
     "create_user",
     "get_user_by_email",
     "get_user_by_id",
+    "get_user_auth_stub",
     "get_user_by_username",
+    "get_users_by_email_or_username",
+    "invalidate_user_cache",
     # Activity
     "create_activity",
+    "create_activities",
     "get_activities_by_user",
     "get_activity_by_id",
     "get_activities_by_type",
     "get_activity_stats",
+    "clear_activity_stats_cache",
+    "delete_activity",
+    "activity_exists",
     "delete_old_activities",
+    "enqueue_activity",
+    "ActivityWriteBuffer",
+    "activity_write_buffer",
 ]
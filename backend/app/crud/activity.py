@@ -1,10 +1,76 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+import atexit
+import logging
+import queue
+import threading
+from collections import OrderedDict, defaultdict
+from sqlalchemy.orm import Session, sessionmaker, raiseload
+from sqlalchemy import Row, func, and_, tuple_, select, insert
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+from app.database import SessionLocal
 from app.models.activity import Activity
 
+logger = logging.getLogger(__name__)
+
+# 목록 조회 시 가져오는 컬럼 (ActivityResponse 필드와 동일)
+_ACTIVITY_LIST_COLUMNS = (
+    Activity.id,
+    Activity.user_id,
+    Activity.action_type,
+    Activity.description,
+    Activity.extra_data,
+    Activity.created_at,
+)
+
+# 활동 통계 캐시 설정
+# 사용자별 활동 버전을 키에 포함하여, 쓰기 후에는 자동으로 새로 계산합니다.
+# 프로세스 내 캐시이므로 여러 워커 프로세스를 사용하면 다른 워커의 쓰기는
+# 해당 워커에서 같은 사용자에 대한 다음 쓰기 전까지 반영되지 않습니다.
+# 이 모듈의 쓰기 함수를 거치지 않고 활동을 변경하면 캐시가 무효화되지 않습니다.
+STATS_CACHE_MAXSIZE = 1024
+
+# user_id -> 활동 버전 (해당 사용자의 활동이 변경될 때마다 증가)
+_activity_versions: Dict[int, int] = defaultdict(int)
+# 전체 활동 버전 (여러 사용자의 활동이 한 번에 변경될 때 증가)
+_activity_generation = 0
+# (user_id, start_date, end_date, generation, version) -> 통계, LRU 순서 유지
+_stats_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+_stats_cache_lock = threading.Lock()
+
+
+def _bump_activity_version(user_id: Optional[int] = None) -> None:
+    """
+    활동 버전 증가 (commit 이후 호출)
+
+    Args:
+        user_id: 변경된 사용자 ID (None이면 전체 사용자)
+    """
+    global _activity_generation
+    with _stats_cache_lock:
+        if user_id is None:
+            _activity_generation += 1
+        else:
+            _activity_versions[user_id] += 1
+
+
+def clear_activity_stats_cache() -> None:
+    """활동 통계 캐시와 버전 정보를 비웁니다."""
+    global _activity_generation
+    with _stats_cache_lock:
+        _stats_cache.clear()
+        _activity_versions.clear()
+        _activity_generation = 0
+
+
+def _copy_stats(stats: Dict) -> Dict:
+    """캐시된 통계가 호출자에 의해 변경되지 않도록 복사"""
+    return {
+        **stats,
+        "by_type": dict(stats["by_type"]),
+        "by_date": dict(stats["by_date"]),
+    }
+
 
 def create_activity(
     db: Session,
@@ -25,6 +91,10 @@ def create_activity(
 
     Returns:
         생성된 Activity 객체
+
+    Note:
+        id와 created_at은 INSERT ... RETURNING(eager_defaults)으로 채워지므로
+        commit 후 refresh를 위한 추가 SELECT를 실행하지 않습니다.
     """
     db_activity = Activity(
         user_id=user_id,
@@ -34,40 +104,96 @@ def create_activity(
     )
     db.add(db_activity)
     db.commit()
-    db.refresh(db_activity)
+    _bump_activity_version(user_id)
     return db_activity
 
 
+def create_activities(db: Session, records: List[dict]) -> int:
+    """
+    활동 기록 일괄 생성
+
+    여러 활동을 단일 executemany INSERT + 한 번의 commit으로 저장합니다.
+    ORM 객체를 만들지 않으므로 생성된 Activity가 필요하면 create_activity를 사용합니다.
+
+    Args:
+        db: SQLAlchemy 세션
+        records: user_id, action_type (필수) 및 description, extra_data (선택) 딕셔너리 리스트
+
+    Returns:
+        저장된 활동 개수
+    """
+    if not records:
+        return 0
+
+    # executemany는 모든 행의 키가 같아야 하므로 선택 필드를 채워서 전달
+    rows = [
+        {
+            "user_id": record["user_id"],
+            "action_type": record["action_type"],
+            "description": record.get("description"),
+            "extra_data": record.get("extra_data"),
+        }
+        for record in records
+    ]
+    db.execute(insert(Activity), rows)
+    db.commit()
+    for user_id in {row["user_id"] for row in rows}:
+        _bump_activity_version(user_id)
+    return len(rows)
+
+
 def get_activities_by_user(
     db: Session,
     user_id: int,
     limit: int = 50,
-    offset: int = 0
-) -> List[Activity]:
+    offset: int = 0,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None
+) -> List[Row]:
     """
     사용자별 활동 조회 (최신순)
 
+    before/before_id를 지정하면 keyset(seek) 페이지네이션으로 동작합니다.
+    (created_at, id)가 해당 값보다 작은 활동만 조회하므로, offset과 달리
+    페이지 깊이와 관계없이 ix_activities_user_created 인덱스 범위만 읽습니다.
+
+    읽기 전용 목록이므로 ORM 객체 대신 Core select()로 컬럼 튜플(Row)을
+    반환하여 행마다 발생하는 ORM 인스턴스 생성/계측 비용을 생략합니다.
+    Row는 속성 접근(row.action_type)을 지원하므로 ActivityResponse로 바로
+    직렬화할 수 있습니다.
+
     Args:
         db: SQLAlchemy 세션
         user_id: 사용자 ID
         limit: 조회 개수 (기본 50)
         offset: 시작 위치 (페이지네이션)
+        before: 이전 페이지 마지막 활동의 created_at (keyset 페이지네이션)
+        before_id: 이전 페이지 마지막 활동의 id (keyset 페이지네이션)
 
     Returns:
-        Activity 객체 리스트
+        활동 Row 리스트 (id, user_id, action_type, description, extra_data, created_at)
     """
-    return db.query(Activity)\
-        .filter(Activity.user_id == user_id)\
-        .order_by(Activity.created_at.desc())\
+    stmt = select(*_ACTIVITY_LIST_COLUMNS).where(Activity.user_id == user_id)
+
+    if before is not None and before_id is not None:
+        stmt = stmt.where(
+            tuple_(Activity.created_at, Activity.id) < (before, before_id)
+        )
+
+    stmt = stmt\
+        .order_by(Activity.created_at.desc(), Activity.id.desc())\
         .limit(limit)\
-        .offset(offset)\
-        .all()
+        .offset(offset)
+    return db.execute(stmt).all()
 
 
 def get_activity_by_id(db: Session, activity_id: int) -> Optional[Activity]:
     """
     특정 활동 조회
 
+    Session.get을 사용하여 세션의 identity map에 이미 로드된 경우
+    SQL을 실행하지 않습니다.
+
     Args:
         db: SQLAlchemy 세션
         activity_id: 활동 ID
@@ -75,7 +201,7 @@ def get_activity_by_id(db: Session, activity_id: int) -> Optional[Activity]:
     Returns:
         Activity 객체 또는 None
     """
-    return db.query(Activity).filter(Activity.id == activity_id).first()
+    return db.get(Activity, activity_id)
 
 
 def get_activities_by_type(
@@ -83,10 +209,15 @@ def get_activities_by_type(
     user_id: int,
     action_type: str,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None
 ) -> List[Activity]:
     """
-    유형별 활동 조회
+    유형별 활동 조회 (최신순)
+
+    before/before_id를 지정하면 keyset(seek) 페이지네이션으로 동작하여
+    ix_activities_user_type_created 인덱스 범위만 읽습니다.
 
     Args:
         db: SQLAlchemy 세션
@@ -94,16 +225,30 @@ def get_activities_by_type(
         action_type: 행동 유형
         limit: 조회 개수
         offset: 시작 위치
+        before: 이전 페이지 마지막 활동의 created_at (keyset 페이지네이션)
+        before_id: 이전 페이지 마지막 활동의 id (keyset 페이지네이션)
 
     Returns:
         필터링된 Activity 객체 리스트
+
+    Note:
+        목록 조회에서는 Activity.user가 필요 없으므로 raiseload로 지정하여
+        실수로 접근 시 행마다 SELECT가 발생(N+1)하는 대신 즉시 에러가 발생합니다.
     """
-    return db.query(Activity)\
+    query = db.query(Activity)\
+        .options(raiseload(Activity.user))\
         .filter(and_(
             Activity.user_id == user_id,
             Activity.action_type == action_type
-        ))\
-        .order_by(Activity.created_at.desc())\
+        ))
+
+    if before is not None and before_id is not None:
+        query = query.filter(
+            tuple_(Activity.created_at, Activity.id) < (before, before_id)
+        )
+
+    return query\
+        .order_by(Activity.created_at.desc(), Activity.id.desc())\
         .limit(limit)\
         .offset(offset)\
         .all()
@@ -118,6 +263,9 @@ def get_activity_stats(
     """
     사용자 활동 통계 조회
 
+    같은 (user_id, start_date, end_date) 조회는 해당 사용자의 활동이
+    변경되기 전까지 캐시된 결과를 반환합니다 (최대 STATS_CACHE_MAXSIZE개).
+
     Args:
         db: SQLAlchemy 세션
         user_id: 사용자 ID
@@ -132,55 +280,369 @@ def get_activity_stats(
             "most_common_action": str
         }
     """
-    query = db.query(Activity).filter(Activity.user_id == user_id)
+    # 쿼리 전에 버전을 읽어야, 쿼리 도중 쓰기가 commit되어도
+    # 이전 버전 키로 저장되어 다음 조회에서 새로 계산됨
+    with _stats_cache_lock:
+        cache_key = (
+            user_id,
+            start_date,
+            end_date,
+            _activity_generation,
+            _activity_versions.get(user_id, 0),
+        )
+        cached = _stats_cache.get(cache_key)
+        if cached is not None:
+            _stats_cache.move_to_end(cache_key)
+            return _copy_stats(cached)
+
+    filters = [Activity.user_id == user_id]
 
     # 날짜 필터링
     if start_date:
-        query = query.filter(Activity.created_at >= start_date)
+        filters.append(Activity.created_at >= start_date)
     if end_date:
-        query = query.filter(Activity.created_at <= end_date)
+        filters.append(Activity.created_at <= end_date)
 
-    activities = query.all()
-
-    # 총 개수
-    total_count = len(activities)
+    # 유형별 카운트 (DB에서 GROUP BY로 집계)
+    type_rows = db.query(Activity.action_type, func.count(Activity.id))\
+        .filter(*filters)\
+        .group_by(Activity.action_type)\
+        .all()
+    by_type = {action_type: count for action_type, count in type_rows}
 
-    # 유형별 카운트
-    by_type = {}
-    for activity in activities:
-        by_type[activity.action_type] = by_type.get(activity.action_type, 0) + 1
+    # 날짜별 카운트 (DB에서 GROUP BY로 집계)
+    activity_date = func.date(Activity.created_at)
+    date_rows = db.query(activity_date, func.count(Activity.id))\
+        .filter(*filters)\
+        .group_by(activity_date)\
+        .all()
+    by_date = {str(date): count for date, count in date_rows}
 
-    # 날짜별 카운트
-    by_date = {}
-    for activity in activities:
-        date_str = activity.created_at.strftime("%Y-%m-%d")
-        by_date[date_str] = by_date.get(date_str, 0) + 1
+    # 총 개수 (유형별 카운트의 합과 동일하므로 별도 COUNT 쿼리 생략)
+    total_count = sum(by_type.values())
 
     # 가장 많은 행동
     most_common_action = max(by_type, key=by_type.get) if by_type else None
 
-    return {
+    stats = {
         "total_count": total_count,
         "by_type": by_type,
         "by_date": by_date,
         "most_common_action": most_common_action
     }
 
+    with _stats_cache_lock:
+        _stats_cache[cache_key] = stats
+        _stats_cache.move_to_end(cache_key)
+        while len(_stats_cache) > STATS_CACHE_MAXSIZE:
+            _stats_cache.popitem(last=False)
+
+    return _copy_stats(stats)
+
+
+def delete_activity(db: Session, activity_id: int, user_id: int) -> int:
+    """
+    본인 활동 단건 삭제
+
+    SELECT 후 DELETE하는 대신 소유자 조건을 포함한 단일
+    DELETE ... WHERE id = :id AND user_id = :uid 로 처리합니다.
+    세션에 로드된 활동은 같은 조건을 Python에서 평가하여 세션에서 제거하므로
+    (synchronize_session="evaluate") 추가 SQL 없이 이후 조회에 남지 않습니다.
+
+    Args:
+        db: SQLAlchemy 세션
+        activity_id: 삭제할 활동 ID
+        user_id: 활동 소유자 ID
+
+    Returns:
+        삭제된 활동 개수 (0 또는 1)
+    """
+    deleted_count = db.query(Activity)\
+        .filter(Activity.id == activity_id, Activity.user_id == user_id)\
+        .delete(synchronize_session="evaluate")
+    db.commit()
+    if deleted_count:
+        _bump_activity_version(user_id)
+    return deleted_count
+
 
-def delete_old_activities(db: Session, days: int = 90) -> int:
+def activity_exists(db: Session, activity_id: int) -> bool:
+    """
+    활동 존재 여부 확인
+
+    delete_activity가 0을 반환했을 때 404(없음)와 403(타인 소유)을
+    구분하기 위해 id 컬럼만 조회합니다.
+
+    Args:
+        db: SQLAlchemy 세션
+        activity_id: 확인할 활동 ID
+
+    Returns:
+        존재하면 True
+    """
+    return db.query(Activity.id).filter_by(id=activity_id).scalar() is not None
+
+
+def delete_old_activities(
+    db: Session,
+    days: int = 90,
+    batch_size: int = 10000
+) -> int:
     """
     오래된 활동 삭제
 
+    한 번에 batch_size개씩 나누어 삭제하고 배치마다 commit하여
+    트랜잭션/락 크기를 제한합니다. 삭제된 행의 id를 받아(synchronize_session="fetch")
+    세션에 로드된 활동을 세션에서 제거하므로, 이후 조회에 삭제된 활동이 남지 않습니다.
+
     Args:
         db: SQLAlchemy 세션
         days: 보관 일수 (기본 90일)
+        batch_size: 한 번에 삭제할 최대 활동 개수 (기본 10000)
 
     Returns:
         삭제된 활동 개수
     """
     cutoff_date = datetime.utcnow() - timedelta(days=days)
-    deleted_count = db.query(Activity)\
-        .filter(Activity.created_at < cutoff_date)\
-        .delete()
-    db.commit()
-    return deleted_count
+    total_deleted = 0
+
+    while True:
+        batch_ids = db.query(Activity.id)\
+            .filter(Activity.created_at < cutoff_date)\
+            .limit(batch_size)\
+            .scalar_subquery()
+        deleted_count = db.query(Activity)\
+            .filter(Activity.id.in_(batch_ids))\
+            .delete(synchronize_session="fetch")
+        db.commit()
+        if deleted_count:
+            _bump_activity_version()
+
+        total_deleted += deleted_count
+        if deleted_count < batch_size:
+            return total_deleted
+
+
+class ActivityWriteBuffer:
+    """
+    활동 기록 배치 쓰기 버퍼
+
+    fire-and-forget 성격의 활동 기록을 메모리 큐에 모아두었다가
+    백그라운드 스레드에서 batch_size개 또는 flush_interval초 단위로
+    Core INSERT (executemany) + 단일 commit으로 저장합니다.
+    N번의 트랜잭션을 1번으로 줄여 쓰기 부하를 낮춥니다.
+
+    생성된 행(id 등)이 바로 필요한 경우에는 create_activity를 사용합니다.
+
+    큐 크기는 max_queue_size로 제한됩니다. 큐가 가득 차면 백그라운드 스레드가
+    실행 중일 때는 put이 자리가 날 때까지 대기하고, 실행 중이 아닐 때는
+    (lifespan 밖에서 사용하는 스크립트 등) 호출한 스레드에서 바로 저장합니다.
+
+    Usage:
+        buffer = ActivityWriteBuffer()
+        buffer.start()
+        buffer.put(user_id=1, action_type="click")
+        buffer.stop()  # 남은 기록을 모두 저장한 뒤 종료
+    """
+
+    __slots__ = (
+        "_session_factory",
+        "_batch_size",
+        "_flush_interval",
+        "_queue",
+        "_stop_event",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        session_factory: sessionmaker = SessionLocal,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        max_queue_size: int = 10000
+    ):
+        """
+        Args:
+            session_factory: 배치 저장에 사용할 세션 팩토리 (기본 SessionLocal)
+            batch_size: 한 번에 저장할 최대 활동 개수
+            flush_interval: 큐가 비어있을 때 대기하는 최대 시간 (초)
+            max_queue_size: 큐에 보관할 최대 활동 개수
+        """
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def put(
+        self,
+        user_id: int,
+        action_type: str,
+        description: Optional[str] = None,
+        extra_data: Optional[dict] = None
+    ) -> None:
+        """
+        활동 기록을 큐에 추가 (DB에는 다음 flush 시 저장)
+
+        created_at은 저장 시점이 아닌 큐에 추가한 시점으로 기록됩니다.
+        백그라운드 스레드가 실행 중이 아닌데 큐가 가득 찼다면
+        먼저 현재 스레드에서 큐를 비웁니다.
+
+        Args:
+            user_id: 사용자 ID
+            action_type: 행동 유형
+            description: 행동 설명 (선택)
+            extra_data: 추가 정보 (선택)
+        """
+        if self._queue.full() and not self._is_running():
+            self.flush()
+        self._queue.put({
+            "user_id": user_id,
+            "action_type": action_type,
+            "description": description,
+            "extra_data": extra_data,
+            "created_at": datetime.utcnow(),
+        })
+
+    def _is_running(self) -> bool:
+        """백그라운드 flush 스레드가 실행 중인지 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """백그라운드 flush 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="activity-write-buffer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 스레드를 종료하고 큐에 남은 기록을 모두 저장"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        """
+        큐에 쌓인 기록을 현재 스레드에서 즉시 저장
+
+        Returns:
+            저장된 활동 개수
+        """
+        written = 0
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                return written
+            written += self._write_batch(batch)
+
+    def _run(self) -> None:
+        """백그라운드 루프: 배치 단위로 큐를 비우며 저장"""
+        while not self._stop_event.is_set():
+            batch = self._drain(block=True)
+            if batch:
+                self._write_batch(batch)
+
+    def _drain(self, block: bool) -> List[dict]:
+        """큐에서 최대 batch_size개의 기록을 꺼냄"""
+        batch: List[dict] = []
+        if block:
+            try:
+                batch.append(self._queue.get(timeout=self._flush_interval))
+            except queue.Empty:
+                return batch
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: List[dict]) -> int:
+        """
+        배치를 단일 트랜잭션으로 저장
+
+        배치 저장에 실패하면 오류를 로그로 남기고 기록을 한 건씩 다시 저장하여,
+        잘못된 기록 하나 때문에 같은 배치의 다른 기록이 버려지지 않도록 합니다.
+        한 건 저장에도 실패한 기록은 로그를 남기고 버립니다.
+        (활동 기록 실패가 다른 기능에 영향을 주지 않도록 함)
+
+        Returns:
+            저장된 활동 개수
+        """
+        try:
+            self._insert(batch)
+            return len(batch)
+        except Exception:
+            if len(batch) == 1:
+                logger.exception(
+                    "Dropping activity record for user_id=%s", batch[0]["user_id"]
+                )
+                return 0
+            logger.exception(
+                "Failed to write activity batch of %d records; retrying one by one",
+                len(batch)
+            )
+
+        written = 0
+        for record in batch:
+            try:
+                self._insert([record])
+                written += 1
+            except Exception:
+                logger.exception(
+                    "Dropping activity record for user_id=%s", record["user_id"]
+                )
+        return written
+
+    def _insert(self, records: List[dict]) -> None:
+        """기록을 단일 트랜잭션으로 저장 (실패 시 롤백 후 예외 전달)"""
+        db = self._session_factory()
+        try:
+            # ORM unit-of-work를 거치지 않는 Core executemany INSERT
+            db.execute(insert(Activity), records)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        for user_id in {record["user_id"] for record in records}:
+            _bump_activity_version(user_id)
+
+
+# 애플리케이션 전역 버퍼 (main.py의 lifespan에서 start/stop)
+activity_write_buffer = ActivityWriteBuffer()
+# lifespan 없이 사용된 경우에도 종료 시 남은 기록을 저장
+atexit.register(activity_write_buffer.stop)
+
+
+def enqueue_activity(
+    user_id: int,
+    action_type: str,
+    description: Optional[str] = None,
+    extra_data: Optional[dict] = None
+) -> None:
+    """
+    활동 기록을 배치 쓰기 버퍼에 추가 (fire-and-forget)
+
+    요청 처리 중 INSERT/commit을 기다리지 않습니다.
+    생성된 Activity 객체가 필요하면 create_activity를 사용합니다.
+
+    Args:
+        user_id: 사용자 ID
+        action_type: 행동 유형 (예: "login", "query", "click")
+        description: 행동 설명 (선택)
+        extra_data: 추가 정보 (선택)
+    """
+    activity_write_buffer.put(
+        user_id=user_id,
+        action_type=action_type,
+        description=description,
+        extra_data=extra_data
+    )
@@ -1,7 +1,24 @@
+import json
+from datetime import datetime
+
+import redis
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
+from app import cache
+from app.config import settings
 from app.models.user import User
 
+# 인증(get_current_user)에 필요한 User 컬럼 - password_hash 제외
+_AUTH_USER_COLUMNS = (
+    User.id,
+    User.username,
+    User.email,
+    User.created_at,
+    User.updated_at,
+)
+_AUTH_USER_DATETIME_FIELDS = ("created_at", "updated_at")
+
 
 def create_user(db: Session, username: str, email: str, password_hash: str) -> User:
     """
@@ -15,6 +32,10 @@ def create_user(db: Session, username: str, email: str, password_hash: str) -> U
 
     Returns:
         생성된 User 객체
+
+    Note:
+        id, created_at, updated_at은 INSERT ... RETURNING(eager_defaults)으로
+        채워지므로 commit 후 refresh를 위한 추가 SELECT를 실행하지 않습니다.
     """
     db_user = User(
         username=username,
@@ -23,7 +44,6 @@ def create_user(db: Session, username: str, email: str, password_hash: str) -> U
     )
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
@@ -55,10 +75,35 @@ def get_user_by_username(db: Session, username: str) -> User | None:
     return db.query(User).filter(User.username == username).first()
 
 
+def get_users_by_email_or_username(
+    db: Session, email: str, username: str
+) -> list[User]:
+    """
+    이메일 또는 사용자명이 일치하는 사용자를 한 번의 쿼리로 조회합니다.
+
+    회원가입 시 email/username 중복 검사를 두 번의 SELECT 대신
+    하나의 SELECT로 처리하기 위해 사용합니다.
+
+    Args:
+        db: SQLAlchemy 세션
+        email: 조회할 이메일
+        username: 조회할 사용자명
+
+    Returns:
+        일치하는 User 객체 리스트 (email, username이 각각 unique이므로 최대 2개)
+    """
+    return db.query(User)\
+        .filter(or_(User.email == email, User.username == username))\
+        .all()
+
+
 def get_user_by_id(db: Session, user_id: int) -> User | None:
     """
     사용자 ID로 사용자를 조회합니다.
 
+    password_hash를 포함한 전체 행이 필요한 경우에 사용합니다.
+    인증 경로에서는 get_user_auth_stub을 사용합니다.
+
     Args:
         db: SQLAlchemy 세션
         user_id: 조회할 사용자 ID
@@ -66,4 +111,105 @@ def get_user_by_id(db: Session, user_id: int) -> User | None:
     Returns:
         User 객체 또는 None (존재하지 않는 경우)
     """
-    return db.query(User).filter(User.id == user_id).first()
+    # identity map에 이미 있으면 SQL 없이 반환
+    return db.get(User, user_id)
+
+
+def get_user_auth_stub(db: Session, user_id: int) -> User | None:
+    """
+    인증에 필요한 컬럼만 담은 사용자를 조회합니다.
+
+    password_hash를 제외한 컬럼(id, username, email, created_at, updated_at)만
+    SELECT하여 인증된 모든 요청에서 읽는 행 크기를 줄입니다.
+    Redis 캐시가 활성화된 경우 `user:{id}` 키를 먼저 조회하고(cache-aside),
+    캐시 미스 시 조회 결과를 USER_CACHE_TTL_SECONDS 동안 캐시합니다.
+
+    반환되는 User는 세션에 속하지 않은(transient) 객체이며 password_hash는
+    None입니다. 로그인/비밀번호 처리에는 get_user_by_email/get_user_by_id를
+    사용합니다.
+
+    Args:
+        db: SQLAlchemy 세션
+        user_id: 조회할 사용자 ID
+
+    Returns:
+        User 객체 또는 None (존재하지 않는 경우)
+    """
+    cached_user = _get_cached_user(user_id)
+    if cached_user is not None:
+        return cached_user
+
+    row = db.execute(
+        select(*_AUTH_USER_COLUMNS).where(User.id == user_id)
+    ).first()
+    if row is None:
+        return None
+
+    data = row._asdict()
+    _set_cached_user(data)
+    return User(**data)
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """
+    사용자 캐시를 무효화합니다.
+
+    사용자 정보를 수정하거나 삭제한 뒤 호출해야 합니다.
+
+    Args:
+        user_id: 캐시를 무효화할 사용자 ID
+    """
+    if cache.redis_client is None:
+        return
+    try:
+        cache.redis_client.delete(_user_cache_key(user_id))
+    except redis.RedisError:
+        pass
+
+
+def _user_cache_key(user_id: int) -> str:
+    """사용자 캐시 키 생성"""
+    return f"user:{user_id}"
+
+
+def _get_cached_user(user_id: int) -> User | None:
+    """
+    Redis 캐시에서 사용자를 조회합니다.
+
+    캐시가 비활성화되어 있거나 Redis 오류가 발생하면 None을 반환하여
+    DB 조회로 대체되도록 합니다.
+    """
+    if cache.redis_client is None:
+        return None
+    try:
+        raw = cache.redis_client.get(_user_cache_key(user_id))
+    except redis.RedisError:
+        return None
+    if raw is None:
+        return None
+
+    data = json.loads(raw)
+    for field in _AUTH_USER_DATETIME_FIELDS:
+        if data.get(field) is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    return User(**data)
+
+
+def _set_cached_user(data: dict) -> None:
+    """인증용 사용자 컬럼을 Redis 캐시에 저장합니다. (Redis 오류는 무시)"""
+    if cache.redis_client is None:
+        return
+
+    serialized = dict(data)
+    for field in _AUTH_USER_DATETIME_FIELDS:
+        value = serialized.get(field)
+        serialized[field] = value.isoformat() if value is not None else None
+
+    try:
+        cache.redis_client.setex(
+            _user_cache_key(data["id"]),
+            settings.USER_CACHE_TTL_SECONDS,
+            json.dumps(serialized),
+        )
+    except redis.RedisError:
+        pass
@@ -1,17 +1,77 @@
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine, make_url
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.expression import FunctionElement
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
+from app.config import settings
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+
+
+def create_db_engine(database_url: str) -> Engine:
+    """
+    설정된 연결 풀 옵션으로 엔진 생성
+
+    요청마다 새 연결을 맺지 않도록 연결 풀을 명시적으로 설정합니다.
+    인메모리 SQLite는 SQLAlchemy가 SingletonThreadPool을 사용하며
+    max_overflow를 받지 않으므로 풀 크기 설정을 생략합니다.
+
+    Args:
+        database_url: 데이터베이스 URL
+
+    Returns:
+        SQLAlchemy Engine
+    """
+    url = make_url(database_url)
+    kwargs = {
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+    is_sqlite = url.get_backend_name() == "sqlite"
+    if is_sqlite:
+        # check_same_thread는 SQLite 전용 옵션
+        kwargs["connect_args"] = {"check_same_thread": False}
+    if not (is_sqlite and url.database in (None, "", ":memory:")):
+        kwargs["pool_size"] = settings.DB_POOL_SIZE
+        kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
+    return create_engine(url, **kwargs)
+
+
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
+# 세션은 요청 단위로 짧게 사용하므로 commit 후 객체를 만료시키지 않음
+# (commit 직후 속성 접근마다 SELECT가 다시 발생하는 것을 방지)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+class utcnow(FunctionElement):
+    """
+    DB 서버 시각(UTC)을 반환하는 SQL 함수 (server_default용)
+
+    기본적으로 CURRENT_TIMESTAMP로 컴파일됩니다. SQLite의 CURRENT_TIMESTAMP는
+    초 단위 문자열("YYYY-MM-DD HH:MM:SS")이라 SQLAlchemy가 저장하는 형식
+    ("YYYY-MM-DD HH:MM:SS.ffffff")과 문자열 비교 시 순서가 어긋나므로,
+    SQLite에서는 같은 형식(밀리초 정밀도)으로 생성합니다.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element, compiler, **kw):
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
 def get_db():
     db = SessionLocal()
     try:
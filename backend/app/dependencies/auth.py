@@ -4,14 +4,14 @@
 JWT 토큰을 검증하고 현재 로그인한 사용자를 반환하는 의존성 함수를 제공합니다.
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from jose import JWTError
+from jwt import PyJWTError as JWTError
 
 from app.database import get_db
 from app.utils.auth import decode_access_token
-from app.crud import get_user_by_id
+from app.crud import get_user_auth_stub
 from app.models.user import User
 
 # OAuth2 토큰 URL 정의 (토큰을 어디서 얻는지 명시)
@@ -19,6 +19,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
 async def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
@@ -27,13 +28,15 @@ async def get_current_user(
 
     로직:
     1. Authorization 헤더에서 Bearer 토큰 추출 (oauth2_scheme이 자동 처리)
-    2. JWT 토큰 디코드
-    3. user_id 추출
-    4. DB에서 User 조회
-    5. User가 없으면 401 Unauthorized
-    6. User 객체 반환
+    2. 같은 요청에서 이미 조회한 User가 request.state에 있으면 재사용
+    3. JWT 토큰 디코드
+    4. user_id 추출
+    5. DB에서 User 조회
+    6. User가 없으면 401 Unauthorized
+    7. request.state에 저장 후 User 객체 반환
 
     Args:
+        request: 현재 요청 객체 (request.state.user에 결과를 저장)
         token: JWT 액세스 토큰
         db: 데이터베이스 세션
 
@@ -43,6 +46,11 @@ async def get_current_user(
     Raises:
         HTTPException: 토큰이 유효하지 않거나 사용자가 없는 경우 401
     """
+    # 2. 같은 요청에서 이미 인증된 사용자가 있으면 재사용
+    cached_user: User | None = getattr(request.state, "user", None)
+    if cached_user is not None:
+        return cached_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -50,10 +58,10 @@ async def get_current_user(
     )
 
     try:
-        # 2. JWT 토큰 디코드
+        # 3. JWT 토큰 디코드
         payload = decode_access_token(token)
 
-        # 3. user_id 추출
+        # 4. user_id 추출
         user_id_str: str = payload.get("sub")
         if user_id_str is None:
             raise credentials_exception
@@ -66,12 +74,13 @@ async def get_current_user(
         # KeyError: payload에서 필요한 키가 없음
         raise credentials_exception
 
-    # 4. DB에서 User 조회
-    user = get_user_by_id(db, user_id)
+    # 5. DB에서 User 조회 (인증에 필요한 컬럼만)
+    user = get_user_auth_stub(db, user_id)
 
-    # 5. User가 없으면 401
+    # 6. User가 없으면 401
     if user is None:
         raise credentials_exception
 
-    # 6. User 객체 반환
+    # 7. request.state에 저장 후 User 객체 반환
+    request.state.user = user
     return user
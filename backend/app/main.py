@@ -1,14 +1,32 @@
-from fastapi import FastAPI
+import json
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config import settings
+from app.crud.activity import activity_write_buffer
 from app.database import engine, Base
 from app.models import User, Example  # noqa: F401 - Import models for table creation
 from app.routers import examples, auth, dashboard
+from app.utils.query_counter import install_query_counter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 시작 시 테이블 생성 및 활동 배치 쓰기 버퍼 시작, 종료 시 남은 기록 저장
+
+    테이블 생성은 임포트 시점이 아닌 시작 시점에 수행하여, 앱을 임포트만 하는
+    경우(테스트 수집, 스크립트 등)에는 DB 연결과 DDL이 발생하지 않도록 합니다.
+    """
+    Base.metadata.create_all(bind=engine)
+    activity_write_buffer.start()
+    yield
+    activity_write_buffer.stop()
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Module 5 API", version="1.0.0")
+app = FastAPI(title="Module 5 API", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -19,12 +37,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 개발 모드: 요청별 SQL 쿼리 수 집계 (N+1 탐지)
+if settings.DEBUG:
+    install_query_counter(app, threshold=settings.QUERY_COUNT_WARN_THRESHOLD)
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(examples.router)
 app.include_router(dashboard.router)
 
 
+# 헬스 체크 응답 본문은 고정값이므로 시작 시 한 번만 직렬화
+_HEALTH_BODY = json.dumps(
+    {"status": "ok", "message": "FastAPI 서버가 정상 작동 중입니다."},
+    ensure_ascii=False,
+    separators=(",", ":"),
+).encode("utf-8")
+
+
 @app.get("/api/health")
 def health_check():
-    return {"status": "ok", "message": "FastAPI 서버가 정상 작동 중입니다."}
+    # 미들웨어가 응답 헤더를 수정하므로 Response 객체는 요청마다 새로 생성
+    return Response(content=_HEALTH_BODY, media_type="application/json")
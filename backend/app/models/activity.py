@@ -1,8 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
-from datetime import datetime
 
-from app.database import Base
+from app.database import Base, utcnow
 
 
 class Activity(Base):
@@ -15,12 +14,13 @@ class Activity(Base):
         action_type: 행동 유형 (100자 이내, Not Null) - 예: "login", "query", "click"
         description: 행동 설명 (Optional)
         extra_data: JSON 형태의 추가 정보 (Optional) - 예: {"ip": "127.0.0.1", "browser": "Chrome"}
-        created_at: 활동 발생 시간 (기본값: 현재 시간)
+        created_at: 활동 발생 시간 (기본값: DB 서버의 현재 UTC 시간)
 
     Indexes:
-        - user_id: 사용자별 조회 성능 향상
+        - ix_activities_user_created: (user_id, created_at, id) - 사용자별 최신순 조회
+        - ix_activities_user_type_created: (user_id, action_type, created_at, id) - 사용자+유형별 최신순 조회
         - action_type: 유형별 필터링
-        - created_at: 시간별 조회
+        - created_at: 시간별 조회 (오래된 활동 삭제)
 
     Relationships:
         - user: User 모델과 N:1 관계
@@ -28,11 +28,29 @@ class Activity(Base):
     __tablename__ = "activities"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     action_type = Column(String(100), nullable=False, index=True)
     description = Column(Text, nullable=True)
     extra_data = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(
+        DateTime(timezone=True), server_default=utcnow(), nullable=False, index=True
+    )
+
+    # user_id 단독 인덱스는 복합 인덱스의 선두 컬럼으로 대체
+    # 목록 쿼리의 WHERE/ORDER BY (created_at DESC, id DESC)와 keyset 조건
+    # (created_at, id) < (...)를 인덱스만으로 처리하도록 id를 마지막 키로 포함
+    # (B-tree는 역방향 스캔이 가능하므로 DESC 인덱스는 불필요)
+    __table_args__ = (
+        Index("ix_activities_user_created", "user_id", "created_at", "id"),
+        Index(
+            "ix_activities_user_type_created",
+            "user_id", "action_type", "created_at", "id"
+        ),
+    )
+
+    # INSERT ... RETURNING으로 server_default(created_at)를 함께 받아와
+    # 생성 직후 별도 SELECT(refresh) 없이 값을 사용할 수 있도록 함
+    __mapper_args__ = {"eager_defaults": True}
 
     # 관계 설정 - User와 양방향 관계
     user = relationship("User", back_populates="activities")
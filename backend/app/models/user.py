@@ -37,6 +37,10 @@ class User(Base):
         Index("ix_users_email", "email", unique=True),
     )
 
+    # INSERT ... RETURNING으로 server_default(created_at, updated_at)를 함께 받아와
+    # 생성 직후 별도 SELECT(refresh) 없이 값을 사용할 수 있도록 함
+    __mapper_args__ = {"eager_defaults": True}
+
     # 관계 설정 - Activity와 1:N 관계
     # cascade="all, delete-orphan": 사용자 삭제 시 관련 활동도 삭제
     activities = relationship("Activity", back_populates="user", cascade="all, delete-orphan")
@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 from app.schemas.auth import UserCreate, UserLogin, Token, UserResponse
 from app.dependencies import get_current_user
 from app.models.user import User
-from app.crud import get_user_by_email, get_user_by_username, create_user
+from app.crud import get_user_by_email, get_users_by_email_or_username, create_user
 from app.database import get_db
 from app.utils.auth import hash_password, verify_password, create_access_token
 
@@ -35,22 +35,26 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         HTTPException 400: 이메일 또는 사용자명이 이미 등록된 경우
 
     로직:
-    1. 중복 email 체크
-    2. 중복 username 체크
+    1-2. 중복 email/username 체크 (단일 쿼리)
     3. 비밀번호 해싱
     4. User 생성
     5. JWT 토큰 발급
     6. Token 응답 반환
     """
+    # 1-2. 중복 email/username 체크 (한 번의 SELECT로 조회)
+    existing_users = get_users_by_email_or_username(
+        db, email=user_data.email, username=user_data.username
+    )
+
     # 1. 중복 email 체크
-    if get_user_by_email(db, user_data.email):
+    if any(user.email == user_data.email for user in existing_users):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
     # 2. 중복 username 체크
-    if get_user_by_username(db, user_data.username):
+    if any(user.username == user_data.username for user in existing_users):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
@@ -6,9 +6,9 @@ Dashboard API 라우터
 - 활동 통계 조회
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from app.database import get_db
@@ -20,10 +20,37 @@ from app.crud import (
     get_activities_by_user,
     get_activity_by_id,
     get_activity_stats,
+    delete_activity,
+    activity_exists,
 )
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
+# 다음 페이지 커서를 전달하는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_cursor(created_at: datetime, activity_id: int) -> str:
+    """keyset 페이지네이션 커서 생성 ("<created_at ISO 8601>_<id>")"""
+    return f"{created_at.isoformat()}_{activity_id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    keyset 페이지네이션 커서 해석
+
+    Raises:
+        HTTPException 400: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        created_at_str, activity_id_str = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(created_at_str), int(activity_id_str)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
 
 @router.post("/activities", response_model=ActivityResponse, status_code=status.HTTP_201_CREATED)
 def create_user_activity(
@@ -56,8 +83,12 @@ def create_user_activity(
 
 @router.get("/activities", response_model=List[ActivityResponse])
 def get_user_activities(
+    response: Response,
     limit: int = Query(50, ge=1, le=100, description="조회할 활동 개수 (1-100)"),
     offset: int = Query(0, ge=0, description="시작 위치 (페이지네이션)"),
+    cursor: Optional[str] = Query(
+        None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 헤더 값)"
+    ),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -65,22 +96,39 @@ def get_user_activities(
     현재 사용자의 활동 목록 조회
 
     최신순으로 정렬되며, 페이지네이션을 지원합니다.
+    cursor를 사용하면 offset 없이 keyset 페이지네이션으로 조회하여
+    페이지 깊이와 관계없이 일정한 비용으로 다음 페이지를 가져옵니다.
+    조회 결과가 limit개이면 X-Next-Cursor 헤더로 다음 페이지 커서를 반환합니다.
 
     Args:
+        response: 응답 객체 (X-Next-Cursor 헤더 설정)
         limit: 조회할 활동 개수 (기본 50, 최대 100)
         offset: 시작 위치 (기본 0)
+        cursor: 다음 페이지 커서 (선택)
         current_user: 현재 인증된 사용자
         db: 데이터베이스 세션
 
     Returns:
         활동 목록 (최신순 정렬)
+
+    Raises:
+        HTTPException 400: 커서 형식이 올바르지 않은 경우
     """
+    before, before_id = _decode_cursor(cursor) if cursor else (None, None)
+
     activities = get_activities_by_user(
         db=db,
         user_id=current_user.id,
         limit=limit,
-        offset=offset
+        offset=offset,
+        before=before,
+        before_id=before_id
     )
+
+    if len(activities) == limit:
+        last = activities[-1]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(last.created_at, last.id)
+
     return activities
 
 
@@ -178,22 +226,19 @@ def delete_user_activity(
         HTTPException 404: 활동을 찾을 수 없는 경우
         HTTPException 403: 본인의 활동이 아닌 경우
     """
-    activity = get_activity_by_id(db=db, activity_id=activity_id)
+    # 소유자 조건을 포함한 단일 DELETE (일반적인 경우 한 번의 왕복)
+    if delete_activity(db=db, activity_id=activity_id, user_id=current_user.id):
+        return None
 
-    if not activity:
+    # 삭제된 행이 없으면 404/403 구분
+    if not activity_exists(db=db, activity_id=activity_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Activity not found"
         )
 
     # 권한 체크: 본인의 활동만 삭제 가능
-    if activity.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this activity"
-        )
-
-    db.delete(activity)
-    db.commit()
-
-    return None
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Not authorized to delete this activity"
+    )
@@ -9,6 +9,7 @@ from .auth import (
     verify_password,
     create_access_token,
     decode_access_token,
+    clear_token_cache,
 )
 from .activity_logger import (
     log_activity,
@@ -20,6 +21,7 @@ __all__ = [
     "verify_password",
     "create_access_token",
     "decode_access_token",
+    "clear_token_cache",
     "log_activity",
     "ActivityLogger",
 ]
@@ -7,14 +7,27 @@ Activity Logging 유틸리티
 import functools
 import inspect
 import asyncio
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict, List
 
 from sqlalchemy.orm import Session
 
-from app.crud.activity import create_activity
+from app.crud.activity import create_activity, create_activities, enqueue_activity
 from app.models.activity import Activity
 
 
+# 위치로 전달될 수 있는 파라미터 종류
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+# 그대로 저장하는 기본 타입 (type() 기준 정확히 일치할 때만)
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# extra_data에서 제외하는 인자 이름 (세션, 사용자 객체, 민감 정보)
+_EXCLUDED_ARG_NAMES = frozenset({"db", "current_user", "password", "password_hash"})
+
+
 def log_activity(
     action_type: Optional[str] = None,
     description: Optional[str] = None,
@@ -25,7 +38,8 @@ def log_activity(
 
     동기 및 비동기 함수 모두 지원합니다.
     함수 파라미터에서 current_user를 찾아 user_id를 추출하고,
-    db 세션을 사용하여 활동을 기록합니다.
+    활동 기록을 배치 쓰기 버퍼(enqueue_activity)에 추가합니다.
+    요청의 db 세션은 사용하지 않으므로 INSERT/commit을 기다리지 않습니다.
 
     Args:
         action_type: 행동 유형 (기본값: 함수 이름)
@@ -45,24 +59,26 @@ def log_activity(
             ...
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            # 원래 함수 실행
-            result = await func(*args, **kwargs)
+        # 시그니처 분석과 action_type 결정은 데코레이션 시점에 한 번만 수행
+        spec = _LogSpec(func, action_type, description, include_args)
 
-            # 활동 로깅 시도 (실패해도 원래 함수 결과는 반환)
-            try:
-                _log_activity_from_call(
-                    func, args, kwargs,
-                    action_type=action_type,
-                    description=description,
-                    include_args=include_args
-                )
-            except Exception:
-                # 로깅 실패 시 조용히 무시 (원래 기능에 영향 없음)
-                pass
+        # 비동기 함수인지 한 번만 확인하여 필요한 래퍼만 정의
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                # 원래 함수 실행
+                result = await func(*args, **kwargs)
 
-            return result
+                # 활동 로깅 시도 (실패해도 원래 함수 결과는 반환)
+                try:
+                    _log_activity_from_call(spec, args, kwargs)
+                except Exception:
+                    # 로깅 실패 시 조용히 무시 (원래 기능에 영향 없음)
+                    pass
+
+                return result
+
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
@@ -71,61 +87,83 @@ def log_activity(
 
             # 활동 로깅 시도 (실패해도 원래 함수 결과는 반환)
             try:
-                _log_activity_from_call(
-                    func, args, kwargs,
-                    action_type=action_type,
-                    description=description,
-                    include_args=include_args
-                )
+                _log_activity_from_call(spec, args, kwargs)
             except Exception:
                 # 로깅 실패 시 조용히 무시 (원래 기능에 영향 없음)
                 pass
 
             return result
 
-        # 비동기 함수인지 확인하여 적절한 래퍼 반환
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
 
     return decorator
 
 
-def _log_activity_from_call(
-    func: Callable,
-    args: tuple,
-    kwargs: dict,
-    action_type: Optional[str],
-    description: Optional[str],
-    include_args: bool
-) -> Optional[Activity]:
+class _LogSpec:
     """
-    함수 호출 정보에서 활동 로깅에 필요한 정보를 추출하여 기록
+    데코레이트된 함수별 로깅 메타데이터
 
-    Args:
-        func: 호출된 함수
-        args: 위치 인자
-        kwargs: 키워드 인자
-        action_type: 행동 유형
+    데코레이션 시점에 한 번 생성되며, 매 호출에서는 이 객체의
+    속성만 읽어 활동을 기록합니다.
+
+    Attributes:
+        action_type: 결정된 행동 유형 (기본값: 함수 이름)
         description: 행동 설명
-        include_args: 인자 포함 여부
+        include_args: 함수 인자를 extra_data에 포함할지 여부
+        arg_indices: 위치 인자 이름 → 인덱스 딕셔너리
+        defaults: 인자 이름 → 기본값 딕셔너리
+        user_index: current_user의 위치 인자 인덱스 (없으면 None)
+    """
 
-    Returns:
-        생성된 Activity 객체 또는 None
+    __slots__ = (
+        "action_type",
+        "description",
+        "include_args",
+        "arg_indices",
+        "defaults",
+        "user_index",
+    )
+
+    def __init__(
+        self,
+        func: Callable,
+        action_type: Optional[str],
+        description: Optional[str],
+        include_args: bool
+    ):
+        self.action_type: str = action_type if action_type else func.__name__
+        self.description = description
+        self.include_args = include_args
+
+        self.arg_indices: Dict[str, int] = {}
+        self.defaults: Dict[str, Any] = {}
+        for name, param in inspect.signature(func).parameters.items():
+            if param.kind in _POSITIONAL_KINDS:
+                self.arg_indices[name] = len(self.arg_indices)
+            if param.default is not inspect.Parameter.empty:
+                self.defaults[name] = param.default
+        self.user_index: Optional[int] = self.arg_indices.get("current_user")
+
+
+def _log_activity_from_call(spec: _LogSpec, args: tuple, kwargs: dict) -> None:
     """
-    # 함수 시그니처 분석
-    sig = inspect.signature(func)
-    bound_args = sig.bind(*args, **kwargs)
-    bound_args.apply_defaults()
-    all_args = bound_args.arguments
-
-    # db 세션 추출
-    db: Optional[Session] = all_args.get("db")
-    if db is None:
-        return None
+    함수 호출 정보에서 활동 로깅에 필요한 정보를 추출하여 버퍼에 추가
+
+    Signature.bind 없이 키워드 인자 → 위치 인자 → 기본값 순서로
+    current_user를 찾습니다.
 
+    Args:
+        spec: 데코레이션 시점에 계산한 로깅 메타데이터
+        args: 위치 인자
+        kwargs: 키워드 인자
+    """
     # current_user에서 user_id 추출
-    current_user = all_args.get("current_user")
+    if "current_user" in kwargs:
+        current_user = kwargs["current_user"]
+    elif spec.user_index is not None and spec.user_index < len(args):
+        current_user = args[spec.user_index]
+    else:
+        current_user = spec.defaults.get("current_user")
     if current_user is None:
         return None
 
@@ -133,24 +171,27 @@ def _log_activity_from_call(
     if user_id is None:
         return None
 
-    # action_type 결정 (기본값: 함수 이름)
-    resolved_action_type = action_type if action_type else func.__name__
-
     # extra_data 구성
     extra_data = None
-    if include_args:
+    if spec.include_args:
+        # 전체 인자 딕셔너리는 include_args일 때만 구성
+        all_args = {**spec.defaults, **dict(zip(spec.arg_indices, args)), **kwargs}
         extra_data = _serialize_args(all_args)
 
-    # 활동 기록 생성
-    return create_activity(
-        db=db,
+    # 활동 기록을 배치 쓰기 버퍼에 추가 (백그라운드 스레드에서 저장)
+    enqueue_activity(
         user_id=user_id,
-        action_type=resolved_action_type,
-        description=description,
+        action_type=spec.action_type,
+        description=spec.description,
         extra_data=extra_data
     )
 
 
+def _coerce_primitive(value: Any) -> Any:
+    """기본 타입은 그대로, 그 외 값은 문자열로 변환"""
+    return value if type(value) in _PRIMITIVE_TYPES else str(value)
+
+
 def _serialize_args(args_dict: dict) -> dict:
     """
     함수 인자를 JSON 직렬화 가능한 형태로 변환
@@ -166,26 +207,23 @@ def _serialize_args(args_dict: dict) -> dict:
     serialized = {}
     for key, value in args_dict.items():
         # 민감하거나 직렬화 불가능한 객체 필터링
-        if key in ("db", "current_user", "password", "password_hash"):
+        if key in _EXCLUDED_ARG_NAMES:
             continue
 
         try:
+            value_type = type(value)
             # 기본 타입은 그대로 사용
-            if isinstance(value, (str, int, float, bool, type(None))):
+            if value_type in _PRIMITIVE_TYPES:
                 serialized[key] = value
-            elif isinstance(value, (list, tuple)):
-                serialized[key] = [
-                    v if isinstance(v, (str, int, float, bool, type(None))) else str(v)
-                    for v in value
-                ]
-            elif isinstance(value, dict):
+            elif value_type is list or value_type is tuple:
+                serialized[key] = [_coerce_primitive(v) for v in value]
+            elif value_type is dict:
                 serialized[key] = {
-                    k: v if isinstance(v, (str, int, float, bool, type(None))) else str(v)
-                    for k, v in value.items()
+                    k: _coerce_primitive(v) for k, v in value.items()
                 }
             elif hasattr(value, "model_dump"):
-                # Pydantic 모델
-                serialized[key] = value.model_dump()
+                # Pydantic 모델 (datetime 등은 JSON 호환 값으로 변환)
+                serialized[key] = value.model_dump(mode="json")
             elif hasattr(value, "dict"):
                 # 구버전 Pydantic 모델
                 serialized[key] = value.dict()
@@ -203,6 +241,9 @@ class ActivityLogger:
     활동 로깅을 위한 유틸리티 클래스
 
     일반적인 활동 로깅 시나리오를 위한 정적 메서드를 제공합니다.
+    user_id가 없으면 DB에 접근하지 않고 건너뛰며, DB 오류는 호출자에게 전달합니다.
+    (요청을 실패시키면 안 되는 fire-and-forget 기록은 enqueue_activity를 사용하며,
+    이 경우 저장 오류는 배치 쓰기 버퍼가 app.crud.activity 로거로 기록합니다)
 
     Usage:
         # 로그인 기록
@@ -213,8 +254,17 @@ class ActivityLogger:
 
         # 에러 기록
         ActivityLogger.log_error(db, user_id=1, error_type="ValueError", error_message="Invalid input")
+
+        # 여러 활동을 한 번에 기록
+        ActivityLogger.log_many(db, [
+            {"user_id": 1, "action_type": "login"},
+            {"user_id": 1, "action_type": "api_call", "description": "GET /api/users"},
+        ])
     """
 
+    # 정적 메서드 전용 클래스이므로 인스턴스 __dict__를 만들지 않음
+    __slots__ = ()
+
     @staticmethod
     def log_login(
         db: Session,
@@ -232,25 +282,28 @@ class ActivityLogger:
             user_agent: 클라이언트 User-Agent (선택)
 
         Returns:
-            생성된 Activity 객체 또는 None (실패 시)
+            생성된 Activity 객체 또는 None (user_id가 없는 경우)
+
+        Raises:
+            SQLAlchemyError: DB 저장에 실패한 경우
         """
-        try:
-            extra_data = {}
-            if ip_address:
-                extra_data["ip_address"] = ip_address
-            if user_agent:
-                extra_data["user_agent"] = user_agent
-
-            return create_activity(
-                db=db,
-                user_id=user_id,
-                action_type="login",
-                description="User logged in",
-                extra_data=extra_data if extra_data else None
-            )
-        except Exception:
+        if not user_id:
             return None
 
+        extra_data = {
+            key: value
+            for key, value in (("ip_address", ip_address), ("user_agent", user_agent))
+            if value
+        } or None
+
+        return create_activity(
+            db=db,
+            user_id=user_id,
+            action_type="login",
+            description="User logged in",
+            extra_data=extra_data
+        )
+
     @staticmethod
     def log_api_call(
         db: Session,
@@ -270,25 +323,31 @@ class ActivityLogger:
             status_code: HTTP 응답 상태 코드 (선택)
 
         Returns:
-            생성된 Activity 객체 또는 None (실패 시)
+            생성된 Activity 객체 또는 None (user_id가 없는 경우)
+
+        Raises:
+            SQLAlchemyError: DB 저장에 실패한 경우
         """
-        try:
+        if not user_id:
+            return None
+
+        # endpoint/method는 항상 포함되므로 dict 리터럴로 바로 구성
+        if status_code is None:
+            extra_data = {"endpoint": endpoint, "method": method}
+        else:
             extra_data = {
                 "endpoint": endpoint,
-                "method": method
+                "method": method,
+                "status_code": status_code
             }
-            if status_code is not None:
-                extra_data["status_code"] = status_code
-
-            return create_activity(
-                db=db,
-                user_id=user_id,
-                action_type="api_call",
-                description=f"{method} {endpoint}",
-                extra_data=extra_data
-            )
-        except Exception:
-            return None
+
+        return create_activity(
+            db=db,
+            user_id=user_id,
+            action_type="api_call",
+            description=f"{method} {endpoint}",
+            extra_data=extra_data
+        )
 
     @staticmethod
     def log_error(
@@ -309,22 +368,48 @@ class ActivityLogger:
             traceback_info: 트레이스백 정보 (선택)
 
         Returns:
-            생성된 Activity 객체 또는 None (실패 시)
+            생성된 Activity 객체 또는 None (user_id가 없는 경우)
+
+        Raises:
+            SQLAlchemyError: DB 저장에 실패한 경우
         """
-        try:
+        if not user_id:
+            return None
+
+        if traceback_info:
             extra_data = {
                 "error_type": error_type,
-                "error_message": error_message
+                "error_message": error_message,
+                "traceback": traceback_info
             }
-            if traceback_info:
-                extra_data["traceback"] = traceback_info
-
-            return create_activity(
-                db=db,
-                user_id=user_id,
-                action_type="error",
-                description=f"{error_type}: {error_message}",
-                extra_data=extra_data
-            )
-        except Exception:
-            return None
+        else:
+            extra_data = {"error_type": error_type, "error_message": error_message}
+
+        return create_activity(
+            db=db,
+            user_id=user_id,
+            action_type="error",
+            description=f"{error_type}: {error_message}",
+            extra_data=extra_data
+        )
+
+    @staticmethod
+    def log_many(db: Session, records: List[dict]) -> int:
+        """
+        여러 활동을 한 번의 INSERT + commit으로 기록
+
+        한 요청에서 여러 활동(예: 로그인 + API 호출)을 기록할 때
+        활동마다 commit하는 대신 모아서 한 번에 저장합니다.
+
+        Args:
+            db: SQLAlchemy 세션
+            records: user_id, action_type (필수) 및 description, extra_data (선택) 딕셔너리 리스트
+
+        Returns:
+            저장된 활동 개수 (user_id가 없는 기록은 제외)
+
+        Raises:
+            SQLAlchemyError: DB 저장에 실패한 경우
+        """
+        valid_records = [record for record in records if record.get("user_id")]
+        return create_activities(db=db, records=valid_records)
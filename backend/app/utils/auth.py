@@ -4,19 +4,35 @@
 비밀번호 해싱 및 JWT 토큰 관리를 위한 함수들을 제공합니다.
 """
 
-from datetime import datetime, timedelta, timezone
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
 from typing import Any
 
 import bcrypt
-from jose import jwt, JWTError
+import jwt
+from jwt import PyJWTError as JWTError
 
 from app.config import settings
 
+# 디코드된 JWT 페이로드 캐시 설정
+# 같은 토큰이 반복해서 제시될 때 HMAC 검증과 JSON 파싱을 생략합니다.
+TOKEN_CACHE_MAXSIZE = 10000
+TOKEN_CACHE_TTL_SECONDS = 30
+
+# (token, secret, algorithm) -> (캐시 만료 시각, 페이로드), LRU 순서 유지
+_token_cache: "OrderedDict[tuple[str, str, str], tuple[float, dict[str, Any]]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 
 def hash_password(password: str) -> str:
     """
     평문 비밀번호를 bcrypt로 해싱합니다.
 
+    cost는 settings.BCRYPT_ROUNDS로 조정합니다 (기본값 12).
+    기존 해시는 해시 문자열에 cost가 포함되어 있어 변경 후에도 검증됩니다.
+
     Args:
         password: 해싱할 평문 비밀번호
 
@@ -24,7 +40,7 @@ def hash_password(password: str) -> str:
         bcrypt로 해싱된 비밀번호 문자열
     """
     password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
@@ -61,13 +77,12 @@ def create_access_token(
     """
     to_encode = data.copy()
 
-    # 만료 시간 설정
+    # 만료 시간 설정 (datetime 변환 없이 POSIX 초 단위 정수로 계산)
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire_seconds = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire_seconds = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    expire = int(time.time()) + expire_seconds
 
     to_encode.update({"exp": expire})
 
@@ -85,6 +100,10 @@ def decode_access_token(token: str) -> dict[str, Any]:
     """
     JWT 토큰을 디코드하고 검증합니다.
 
+    검증에 성공한 페이로드는 최대 TOKEN_CACHE_TTL_SECONDS 동안 캐시되며,
+    토큰의 exp보다 오래 캐시되지 않으므로 만료된 토큰은 항상 재검증되어
+    JWTError가 발생합니다.
+
     Args:
         token: 디코드할 JWT 토큰 문자열
 
@@ -94,9 +113,40 @@ def decode_access_token(token: str) -> dict[str, Any]:
     Raises:
         JWTError: 토큰이 유효하지 않거나 만료된 경우
     """
+    now = time.time()
+    cache_key = (token, settings.SECRET_KEY, settings.ALGORITHM)
+
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+        if cached is not None:
+            cached_until, cached_payload = cached
+            if now < cached_until:
+                _token_cache.move_to_end(cache_key)
+                return dict(cached_payload)
+            del _token_cache[cache_key]
+
     payload = jwt.decode(
         token,
         settings.SECRET_KEY,
         algorithms=[settings.ALGORITHM]
     )
-    return payload
+
+    # 캐시 만료 시각은 토큰 만료 시각(exp)을 넘지 않도록 제한
+    cached_until = now + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        cached_until = min(cached_until, exp)
+
+    with _token_cache_lock:
+        _token_cache[cache_key] = (cached_until, payload)
+        _token_cache.move_to_end(cache_key)
+        while len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+
+    return dict(payload)
+
+
+def clear_token_cache() -> None:
+    """디코드된 JWT 페이로드 캐시를 비웁니다."""
+    with _token_cache_lock:
+        _token_cache.clear()
@@ -0,0 +1,78 @@
+"""
+요청별 SQL 쿼리 카운트 유틸리티 (개발용)
+
+요청마다 실행된 SQL 쿼리 수를 세어 응답 헤더(X-Query-Count)로 노출하고,
+임계값을 넘으면 경고 로그를 남겨 N+1 쿼리를 조기에 발견합니다.
+settings.DEBUG가 활성화된 경우에만 main.py에서 설치되므로
+운영 환경에는 오버헤드가 없습니다.
+"""
+
+import logging
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 요청별 쿼리 수를 전달하는 응답 헤더
+QUERY_COUNT_HEADER = "X-Query-Count"
+
+
+class QueryCounter:
+    """요청 하나에서 실행된 쿼리 수"""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+
+# 현재 요청의 카운터 (동기 엔드포인트의 스레드풀에도 컨텍스트가 복사됨)
+_current_counter: ContextVar[Optional[QueryCounter]] = ContextVar(
+    "query_counter", default=None
+)
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    """before_cursor_execute 이벤트 리스너: 현재 요청의 쿼리 수 증가"""
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+def install_query_counter(app: FastAPI, threshold: int) -> None:
+    """
+    앱에 쿼리 카운트 미들웨어를 설치합니다.
+
+    모든 Engine의 before_cursor_execute 이벤트를 구독하므로
+    테스트에서 오버라이드한 엔진의 쿼리도 집계됩니다.
+
+    Args:
+        app: FastAPI 앱
+        threshold: 경고 로그를 남길 요청당 쿼리 수 기준
+    """
+    if not event.contains(Engine, "before_cursor_execute", _count_query):
+        event.listen(Engine, "before_cursor_execute", _count_query)
+
+    @app.middleware("http")
+    async def query_count_middleware(request: Request, call_next):
+        counter = QueryCounter()
+        token = _current_counter.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            _current_counter.reset(token)
+
+        response.headers[QUERY_COUNT_HEADER] = str(counter.count)
+        if counter.count > threshold:
+            logger.warning(
+                "%s %s executed %d queries (threshold: %d)",
+                request.method,
+                request.url.path,
+                counter.count,
+                threshold,
+            )
+        return response
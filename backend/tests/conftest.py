@@ -2,45 +2,206 @@
 테스트 픽스처 설정
 
 테스트용 인메모리 SQLite DB를 사용하여 각 테스트를 격리합니다.
+스키마는 테스트 세션당 한 번만 생성하고, 각 테스트는 트랜잭션 안에서
+실행한 뒤 롤백하여 DDL(create_all/drop_all) 반복 비용을 없앱니다.
+
+인메모리 DB는 프로세스마다 독립적이므로 pytest-xdist로 병렬 실행해도
+(pytest -n auto) 워커 간에 데이터가 공유되지 않습니다.
 """
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.database import Base
+# 모델 임포트 - 테이블 생성을 위해 필요
+from app import models  # noqa: F401
 
 
 # 테스트용 인메모리 SQLite DB
-TEST_DATABASE_URL = "sqlite:///:memory:"
+TEST_DATABASE_URL = "sqlite://"
 
 
-@pytest.fixture
-def db() -> Session:
+@pytest.fixture(scope="session")
+def engine() -> Engine:
     """
-    테스트용 DB 세션 픽스처
+    테스트 세션 전체에서 공유하는 엔진 픽스처
 
-    각 테스트마다 새로운 인메모리 DB를 생성하고,
-    테스트 종료 후 정리합니다.
+    StaticPool로 단일 커넥션을 재사용하여 인메모리 DB가 유지되며,
+    테이블은 한 번만 생성합니다.
 
     Yields:
-        Session: SQLAlchemy 세션 객체
+        Engine: SQLAlchemy 엔진 객체
     """
-    # 테스트용 엔진 생성
-    engine = create_engine(
+    test_engine = create_engine(
         TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite의 자체 트랜잭션 처리를 끄고 BEGIN을 직접 실행해야
+    # SAVEPOINT(begin_nested)가 올바르게 동작합니다.
+    @event.listens_for(test_engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    # 테스트 DB는 내구성이 필요 없으므로 저널/동기화 비용 제거
+    @event.listens_for(test_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(test_engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=test_engine)
+
+    yield test_engine
+
+    Base.metadata.drop_all(bind=test_engine)
+    test_engine.dispose()
+
+
+@pytest.fixture
+def connection(engine: Engine) -> Connection:
+    """
+    테스트별 커넥션 픽스처
+
+    바깥 트랜잭션을 시작한 커넥션을 제공하고, 테스트 종료 후
+    트랜잭션을 롤백하여 테스트 중 변경 사항을 모두 되돌립니다.
+
+    Yields:
+        Connection: 트랜잭션이 시작된 SQLAlchemy 커넥션
+    """
+    test_connection = engine.connect()
+    transaction = test_connection.begin()
+
+    yield test_connection
+
+    transaction.rollback()
+    test_connection.close()
+
+
+# bcrypt가 허용하는 최소 cost (운영 기본값 12 대비 해싱 시간 약 1/256)
+TEST_BCRYPT_ROUNDS = 4
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """
+    테스트 세션 동안 bcrypt cost를 최소값으로 낮추는 픽스처
+
+    실제 bcrypt 해싱/검증 경로는 그대로 사용하면서, 회원가입/로그인마다
+    발생하는 의도적인 해싱 비용만 줄입니다.
+    """
+    from app.config import settings
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(settings, "BCRYPT_ROUNDS", TEST_BCRYPT_ROUNDS)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    """
+    테스트마다 활동 통계 캐시 초기화
+
+    테스트 롤백 후에는 같은 user_id와 활동 버전이 다시 나올 수 있으므로
+    이전 테스트의 캐시 결과가 재사용되지 않도록 비웁니다.
+    """
+    from app.crud.activity import clear_activity_stats_cache
+
+    clear_activity_stats_cache()
+    yield
+    clear_activity_stats_cache()
+
+
+def _savepoint_session(connection: Connection) -> Session:
+    """commit/rollback이 SAVEPOINT 단위로만 동작하는 세션 생성"""
+    return Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
 
-    # 테이블 생성
-    Base.metadata.create_all(bind=engine)
 
-    # 세션 생성
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = TestSessionLocal()
+@pytest.fixture
+def db(connection: Connection) -> Session:
+    """
+    테스트용 DB 세션 픽스처
+
+    바깥 트랜잭션을 시작한 커넥션에 세션을 바인딩하고,
+    세션의 commit/rollback은 SAVEPOINT 단위로만 동작하도록 합니다.
+
+    Yields:
+        Session: SQLAlchemy 세션 객체
+    """
+    session = _savepoint_session(connection)
 
     yield session
 
     # 정리
     session.close()
-    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """
+    FastAPI 앱 픽스처
+
+    app.main 임포트는 라우터/의존성 전체를 불러오므로, API 테스트가
+    수집·실행될 때만 처음 사용 시점에 임포트합니다.
+
+    Returns:
+        FastAPI: 애플리케이션 인스턴스
+    """
+    from app.main import app as fastapi_app
+
+    return fastapi_app
+
+
+@pytest.fixture
+def override_get_db(app: FastAPI, connection: Connection):
+    """
+    API 테스트용 get_db 의존성 오버라이드 픽스처
+
+    요청마다 테스트 커넥션에 바인딩된 새 세션을 제공하므로
+    운영 환경처럼 요청 단위 세션을 사용하면서도, 테스트 종료 시
+    바깥 트랜잭션 롤백으로 DDL 없이 DB가 초기화됩니다.
+    """
+    from app.database import get_db
+
+    def _override_get_db():
+        session = _savepoint_session(connection)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = _override_get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> TestClient:
+    """
+    테스트 세션 전체에서 공유하는 HTTP 클라이언트 픽스처
+
+    앱은 전역 싱글톤이므로 클라이언트를 한 번만 생성하고,
+    테스트별로 달라지는 DB 세션은 override_get_db가 담당합니다.
+    lifespan(배치 쓰기 버퍼 스레드)은 실행하지 않도록 컨텍스트 매니저 없이 생성합니다.
+
+    Returns:
+        TestClient: FastAPI 테스트 클라이언트
+    """
+    return TestClient(app)
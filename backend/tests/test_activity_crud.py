@@ -8,23 +8,35 @@ Activity 모델 및 CRUD 함수 테스트
 - CRUD 함수 동작 검증
 - 페이지네이션 및 필터링
 - 통계 함수 테스트
+- 본인 활동 단건 삭제
 - 오래된 활동 삭제
+- 배치 쓰기 버퍼 (ActivityWriteBuffer)
 - Cascade 삭제 테스트
 """
 
+import logging
+
 import pytest
 from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event, insert, inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
 
+from app.database import Base
 from app.models.activity import Activity
 from app.models.user import User
 from app.crud.user import create_user
 from app.crud.activity import (
     create_activity,
+    create_activities,
     get_activities_by_user,
     get_activity_by_id,
     get_activities_by_type,
     get_activity_stats,
+    delete_activity,
+    activity_exists,
     delete_old_activities,
+    ActivityWriteBuffer,
 )
 
 
@@ -42,6 +54,16 @@ def create_test_user(db, username="testuser", email="test@example.com"):
     )
 
 
+def buffer_session_factory(db):
+    """
+    테스트 DB 커넥션에 바인딩된 버퍼용 세션 팩토리 헬퍼
+
+    버퍼의 commit/rollback이 테스트의 바깥 트랜잭션이 아닌
+    SAVEPOINT 단위로만 동작하도록 합니다.
+    """
+    return sessionmaker(bind=db.get_bind(), join_transaction_mode="create_savepoint")
+
+
 # ============================================================================
 # Activity Model Tests
 # ============================================================================
@@ -93,6 +115,20 @@ class TestActivityModelFields:
         assert activity.description == "Button clicked"
         assert activity.extra_data == {"button_id": "submit"}
 
+    def test_activity_composite_indexes(self, db):
+        """조회 조건(WHERE/ORDER BY)에 맞는 복합 인덱스가 생성되는지 확인"""
+        indexes = {
+            index["name"]: index["column_names"]
+            for index in inspect(db.get_bind()).get_indexes("activities")
+        }
+
+        assert indexes["ix_activities_user_created"] == ["user_id", "created_at", "id"]
+        assert indexes["ix_activities_user_type_created"] == [
+            "user_id", "action_type", "created_at", "id"
+        ]
+        # user_id 단독 인덱스는 복합 인덱스로 대체됨
+        assert "ix_activities_user_id" not in indexes
+
 
 class TestActivityForeignKeyRelation:
     """Foreign Key 관계 테스트"""
@@ -135,7 +171,9 @@ class TestActivityCreatedAtAutoGeneration:
         """Activity 생성 시 created_at이 자동으로 설정되는지 확인"""
         user = create_test_user(db, username="timeuser", email="time@example.com")
 
-        before_creation = datetime.utcnow()
+        # created_at은 DB 서버 시각(SQLite에서는 밀리초 정밀도)으로 생성됨
+        now = datetime.utcnow()
+        before_creation = now.replace(microsecond=now.microsecond // 1000 * 1000)
 
         activity = create_activity(
             db=db,
@@ -222,6 +260,57 @@ class TestCreateActivity:
         assert activity.description is None
         assert activity.extra_data is None
 
+    def test_create_activities_bulk(self, db):
+        """여러 활동을 한 번에 생성 (선택 필드 생략 가능)"""
+        user = create_test_user(db, username="bulkuser", email="bulk@example.com")
+
+        count = create_activities(db, [
+            {"user_id": user.id, "action_type": "login"},
+            {
+                "user_id": user.id,
+                "action_type": "api_call",
+                "description": "GET /api/items",
+                "extra_data": {"method": "GET"},
+            },
+        ])
+
+        activities = db.query(Activity).order_by(Activity.id).all()
+        assert count == 2
+        assert [a.action_type for a in activities] == ["login", "api_call"]
+        assert activities[0].description is None
+        assert activities[1].extra_data == {"method": "GET"}
+        assert all(a.created_at is not None for a in activities)
+
+    def test_create_activity_single_insert_without_refresh(self, db):
+        """INSERT ... RETURNING 한 번으로 id/created_at을 채우고 추가 SELECT 없음"""
+        user = create_test_user(db, username="returninguser", email="returning@example.com")
+        user_id = user.id
+
+        statements = []
+
+        def count_statements(conn, cursor, statement, parameters, context, executemany):
+            # 테스트 픽스처의 SAVEPOINT 관리 구문은 제외
+            if "SAVEPOINT" not in statement:
+                statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statements)
+        try:
+            activity = create_activity(db, user_id, "login")
+            activity_id = activity.id
+            created_at = activity.created_at
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statements)
+
+        assert activity_id is not None
+        assert isinstance(created_at, datetime)
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith("INSERT")
+
+    def test_create_activities_empty(self, db):
+        """빈 리스트면 아무것도 저장하지 않고 0 반환"""
+        assert create_activities(db, []) == 0
+
 
 class TestGetActivitiesByUser:
     """get_activities_by_user 함수 테스트"""
@@ -284,9 +373,11 @@ class TestGetActivitiesByUser:
         """페이지네이션 - limit 동작 확인"""
         user = create_test_user(db, username="limituser", email="limit@example.com")
 
-        # 5개 활동 생성
-        for i in range(5):
-            create_activity(db, user.id, f"action_{i}", f"Action {i}")
+        # 5개 활동 생성 (단일 executemany INSERT)
+        create_activities(db, [
+            {"user_id": user.id, "action_type": f"action_{i}", "description": f"Action {i}"}
+            for i in range(5)
+        ])
 
         # limit=3으로 조회
         activities = get_activities_by_user(db, user.id, limit=3)
@@ -297,11 +388,11 @@ class TestGetActivitiesByUser:
         """페이지네이션 - offset 동작 확인"""
         user = create_test_user(db, username="offsetuser", email="offset@example.com")
 
-        # 5개 활동 생성 - ID 저장
-        created_activities = []
-        for i in range(5):
-            act = create_activity(db, user.id, f"action_{i}", f"Action {i}")
-            created_activities.append(act)
+        # 5개 활동 생성 (단일 executemany INSERT)
+        create_activities(db, [
+            {"user_id": user.id, "action_type": f"action_{i}", "description": f"Action {i}"}
+            for i in range(5)
+        ])
 
         # offset=2로 조회 (처음 2개 건너뜀)
         activities = get_activities_by_user(db, user.id, offset=2)
@@ -316,9 +407,11 @@ class TestGetActivitiesByUser:
         """페이지네이션 - limit과 offset 조합"""
         user = create_test_user(db, username="pageuser", email="page@example.com")
 
-        # 10개 활동 생성
-        for i in range(10):
-            create_activity(db, user.id, f"action_{i}", f"Action {i}")
+        # 10개 활동 생성 (단일 executemany INSERT)
+        create_activities(db, [
+            {"user_id": user.id, "action_type": f"action_{i}", "description": f"Action {i}"}
+            for i in range(10)
+        ])
 
         # offset=3, limit=2로 조회
         activities = get_activities_by_user(db, user.id, limit=2, offset=3)
@@ -334,6 +427,49 @@ class TestGetActivitiesByUser:
         assert len(activities) == 0
         assert activities == []
 
+    def test_get_activities_by_user_keyset_pagination(self, db):
+        """keyset 페이지네이션 - (created_at, id) 이전 활동만 조회"""
+        user = create_test_user(db, username="keysetuser", email="keyset@example.com")
+
+        # 동일한 created_at을 가진 활동 포함 (id로 순서 결정)
+        same_time = datetime.utcnow() - timedelta(minutes=1)
+        db.execute(insert(Activity), [
+            {"user_id": user.id, "action_type": f"action_{i}", "created_at": same_time}
+            for i in range(5)
+        ])
+        db.commit()
+
+        first_page = get_activities_by_user(db, user.id, limit=2)
+        last = first_page[-1]
+        second_page = get_activities_by_user(
+            db, user.id, limit=2, before=last.created_at, before_id=last.id
+        )
+        last = second_page[-1]
+        third_page = get_activities_by_user(
+            db, user.id, limit=2, before=last.created_at, before_id=last.id
+        )
+
+        assert [a.action_type for a in first_page] == ["action_4", "action_3"]
+        assert [a.action_type for a in second_page] == ["action_2", "action_1"]
+        assert [a.action_type for a in third_page] == ["action_0"]
+
+    def test_get_activities_by_user_returns_rows(self, db):
+        """ORM 객체 대신 응답 스키마 컬럼만 담은 Row를 반환"""
+        user = create_test_user(db, username="rowuser", email="row@example.com")
+        created = create_activity(db, user.id, "login", "Login", {"ip": "127.0.0.1"})
+
+        activities = get_activities_by_user(db, user.id)
+
+        assert not isinstance(activities[0], Activity)
+        assert activities[0]._asdict() == {
+            "id": created.id,
+            "user_id": user.id,
+            "action_type": "login",
+            "description": "Login",
+            "extra_data": {"ip": "127.0.0.1"},
+            "created_at": created.created_at,
+        }
+
 
 class TestGetActivityById:
     """get_activity_by_id 함수 테스트"""
@@ -359,6 +495,26 @@ class TestGetActivityById:
 
         assert result is None
 
+    def test_get_activity_by_id_uses_identity_map(self, db):
+        """세션에 이미 로드된 활동은 SQL 실행 없이 반환"""
+        user = create_test_user(db, username="identityuser", email="identity@example.com")
+        created_activity = create_activity(db, user.id, "login", "Login activity")
+
+        statements = []
+
+        def count_statements(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statements)
+        try:
+            found_activity = get_activity_by_id(db, created_activity.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statements)
+
+        assert found_activity is created_activity
+        assert statements == []
+
 
 class TestGetActivitiesByType:
     """get_activities_by_type 함수 테스트"""
@@ -379,6 +535,17 @@ class TestGetActivitiesByType:
         assert len(activities) == 2
         assert all(a.action_type == "login" for a in activities)
 
+    def test_get_activities_by_type_user_relation_raiseload(self, db):
+        """목록 조회 결과에서 Activity.user 접근 시 N+1 대신 에러 발생"""
+        user = create_test_user(db, username="raiseuser", email="raise@example.com")
+        create_activity(db, user.id, "login", "Login")
+        db.expire_all()
+
+        activities = get_activities_by_type(db, user.id, "login")
+
+        with pytest.raises(InvalidRequestError):
+            activities[0].user
+
     def test_get_activities_by_type_excludes_others(self, db):
         """다른 유형은 제외되는지 확인"""
         user = create_test_user(db, username="excludeuser", email="exclude@example.com")
@@ -398,15 +565,47 @@ class TestGetActivitiesByType:
         """페이지네이션 동작 확인"""
         user = create_test_user(db, username="typepageuser", email="typepage@example.com")
 
-        # 같은 유형의 활동 5개 생성
-        for i in range(5):
-            create_activity(db, user.id, "login", f"Login {i}")
+        # 같은 유형의 활동 5개 생성 (단일 executemany INSERT)
+        create_activities(db, [
+            {"user_id": user.id, "action_type": "login", "description": f"Login {i}"}
+            for i in range(5)
+        ])
 
         # limit=2, offset=1로 조회
         activities = get_activities_by_type(db, user.id, "login", limit=2, offset=1)
 
         assert len(activities) == 2
 
+    def test_get_activities_by_type_keyset_pagination(self, db):
+        """keyset 페이지네이션 결과가 offset 페이지네이션과 동일한지 확인"""
+        user = create_test_user(db, username="typekeyuser", email="typekey@example.com")
+
+        same_time = datetime.utcnow() - timedelta(minutes=1)
+        db.execute(insert(Activity), [
+            {"user_id": user.id, "action_type": "login", "description": f"Login {i}", "created_at": same_time}
+            for i in range(5)
+        ] + [
+            {"user_id": user.id, "action_type": "query", "description": None, "created_at": same_time}
+        ])
+        db.commit()
+
+        pages = [get_activities_by_type(db, user.id, "login", limit=2)]
+        while len(pages[-1]) == 2:
+            last = pages[-1][-1]
+            pages.append(get_activities_by_type(
+                db, user.id, "login", limit=2, before=last.created_at, before_id=last.id
+            ))
+
+        keyset_ids = [a.id for page in pages for a in page]
+        offset_ids = [
+            a.id
+            for offset in (0, 2, 4)
+            for a in get_activities_by_type(db, user.id, "login", limit=2, offset=offset)
+        ]
+        assert keyset_ids == offset_ids
+        assert [a.description for a in pages[0]] == ["Login 4", "Login 3"]
+        assert len(keyset_ids) == 5
+
     def test_get_activities_by_type_not_found(self, db):
         """존재하지 않는 유형 조회"""
         user = create_test_user(db, username="notypeuser", email="notype@example.com")
@@ -425,8 +624,10 @@ class TestGetActivityStats:
         """총 개수 계산 확인"""
         user = create_test_user(db, username="statsuser", email="stats@example.com")
 
-        for i in range(5):
-            create_activity(db, user.id, "login", f"Login {i}")
+        create_activities(db, [
+            {"user_id": user.id, "action_type": "login", "description": f"Login {i}"}
+            for i in range(5)
+        ])
 
         stats = get_activity_stats(db, user.id)
 
@@ -463,6 +664,23 @@ class TestGetActivityStats:
         assert today in stats["by_date"]
         assert stats["by_date"][today] == 2
 
+    def test_get_activity_stats_by_date_multiple_days(self, db):
+        """여러 날짜에 걸친 활동이 날짜별로 집계되는지 확인"""
+        user = create_test_user(db, username="multidayuser", email="multiday@example.com")
+
+        db.add_all([
+            Activity(user_id=user.id, action_type="login", created_at=datetime(2024, 1, 1, 9, 0)),
+            Activity(user_id=user.id, action_type="query", created_at=datetime(2024, 1, 1, 23, 59)),
+            Activity(user_id=user.id, action_type="login", created_at=datetime(2024, 1, 2, 0, 0)),
+        ])
+        db.commit()
+
+        stats = get_activity_stats(db, user.id)
+
+        assert stats["total_count"] == 3
+        assert stats["by_date"] == {"2024-01-01": 2, "2024-01-02": 1}
+        assert stats["by_type"] == {"login": 2, "query": 1}
+
     def test_get_activity_stats_most_common_action(self, db):
         """most_common_action 계산 확인"""
         user = create_test_user(db, username="commonuser", email="common@example.com")
@@ -509,6 +727,123 @@ class TestGetActivityStats:
         assert stats["by_date"] == {}
         assert stats["most_common_action"] is None
 
+    def test_get_activity_stats_cached_without_query(self, db):
+        """변경이 없으면 두 번째 조회는 SQL 실행 없이 캐시된 결과 반환"""
+        user = create_test_user(db, username="cacheduser", email="cached@example.com")
+        user_id = user.id
+        create_activity(db, user_id, "login")
+        first = get_activity_stats(db, user_id)
+
+        statements = []
+
+        def count_statements(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statements)
+        try:
+            second = get_activity_stats(db, user_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statements)
+
+        assert second == first
+        assert statements == []
+
+    def test_get_activity_stats_cache_invalidated_by_writes(self, db):
+        """활동 생성/삭제 후에는 새로 계산된 통계 반환"""
+        user = create_test_user(db, username="invaliduser", email="invalid@example.com")
+        activity = create_activity(db, user.id, "login")
+        assert get_activity_stats(db, user.id)["total_count"] == 1
+
+        create_activities(db, [{"user_id": user.id, "action_type": "query"}])
+        assert get_activity_stats(db, user.id)["by_type"] == {"login": 1, "query": 1}
+
+        delete_activity(db, activity.id, user.id)
+        assert get_activity_stats(db, user.id)["by_type"] == {"query": 1}
+
+    def test_get_activity_stats_cache_is_per_user_and_range(self, db):
+        """다른 사용자의 쓰기나 다른 기간 조회는 서로 영향을 주지 않음"""
+        user = create_test_user(db, username="rangeuser", email="range@example.com")
+        other = create_test_user(db, username="rangeother", email="rangeother@example.com")
+        create_activity(db, user.id, "login")
+        far_future = datetime.utcnow() + timedelta(days=10)
+
+        assert get_activity_stats(db, user.id)["total_count"] == 1
+        assert get_activity_stats(db, user.id, start_date=far_future)["total_count"] == 0
+
+        create_activity(db, other.id, "login")
+
+        assert get_activity_stats(db, user.id)["total_count"] == 1
+        assert get_activity_stats(db, other.id)["total_count"] == 1
+
+    def test_get_activity_stats_returns_independent_copies(self, db):
+        """반환된 딕셔너리를 수정해도 캐시된 결과는 바뀌지 않음"""
+        user = create_test_user(db, username="copyuser", email="copy@example.com")
+        create_activity(db, user.id, "login")
+
+        stats = get_activity_stats(db, user.id)
+        stats["by_type"]["login"] = 100
+        stats["total_count"] = 100
+
+        fresh = get_activity_stats(db, user.id)
+        assert fresh["by_type"] == {"login": 1}
+        assert fresh["total_count"] == 1
+
+
+class TestDeleteActivity:
+    """delete_activity / activity_exists 함수 테스트"""
+
+    def test_delete_own_activity(self, db):
+        """본인 활동은 단일 DELETE로 삭제되고 1 반환"""
+        user = create_test_user(db, username="owner", email="owner@example.com")
+        user_id = user.id
+        activity = create_activity(db, user_id, "login")
+        activity_id = activity.id
+
+        statements = []
+
+        def count_statements(conn, cursor, statement, parameters, context, executemany):
+            # 테스트 픽스처의 SAVEPOINT 관리 구문은 제외
+            if "SAVEPOINT" not in statement:
+                statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statements)
+        try:
+            deleted_count = delete_activity(db, activity_id, user_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statements)
+
+        assert deleted_count == 1
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith("DELETE")
+        assert activity_exists(db, activity_id) is False
+
+    def test_delete_other_users_activity_returns_zero(self, db):
+        """타인 활동은 삭제되지 않고 0 반환"""
+        owner = create_test_user(db, username="owner", email="owner@example.com")
+        other = create_test_user(db, username="other", email="other@example.com")
+        activity = create_activity(db, owner.id, "login")
+
+        assert delete_activity(db, activity.id, other.id) == 0
+        assert activity_exists(db, activity.id) is True
+
+    def test_delete_nonexistent_activity_returns_zero(self, db):
+        """존재하지 않는 활동은 0 반환"""
+        user = create_test_user(db)
+
+        assert delete_activity(db, 99999, user.id) == 0
+        assert activity_exists(db, 99999) is False
+
+    def test_deleted_activity_not_returned_from_session(self, db):
+        """세션에 로드된 활동도 삭제 후에는 get_activity_by_id가 None 반환"""
+        user = create_test_user(db)
+        activity = create_activity(db, user.id, "login")
+
+        delete_activity(db, activity.id, user.id)
+
+        assert get_activity_by_id(db, activity.id) is None
+
 
 class TestDeleteOldActivities:
     """delete_old_activities 함수 테스트"""
@@ -576,13 +911,11 @@ class TestDeleteOldActivities:
         user = create_test_user(db, username="countuser", email="count@example.com")
 
         # 오래된 활동 3개 생성
-        for i in range(3):
-            old_activity = Activity(
-                user_id=user.id,
-                action_type=f"old_{i}",
-                created_at=datetime.utcnow() - timedelta(days=100),
-            )
-            db.add(old_activity)
+        old_date = datetime.utcnow() - timedelta(days=100)
+        db.execute(insert(Activity), [
+            {"user_id": user.id, "action_type": f"old_{i}", "created_at": old_date}
+            for i in range(3)
+        ])
         db.commit()
 
         deleted_count = delete_old_activities(db, days=90)
@@ -616,6 +949,117 @@ class TestDeleteOldActivities:
 
         assert deleted_count == 0
 
+    def test_delete_old_activities_in_batches(self, db):
+        """batch_size보다 많은 오래된 활동도 배치로 나누어 모두 삭제"""
+        user = create_test_user(db, username="batchdeluser", email="batchdel@example.com")
+
+        old_date = datetime.utcnow() - timedelta(days=100)
+        db.execute(insert(Activity), [
+            {"user_id": user.id, "action_type": f"old_{i}", "created_at": old_date}
+            for i in range(7)
+        ])
+        db.commit()
+        create_activity(db, user.id, "recent_action", "Recent activity")
+        # 세션에 로드된 오래된 활동도 삭제 후 조회되지 않아야 함
+        loaded = db.query(Activity).filter_by(action_type="old_0").one()
+
+        deleted_count = delete_old_activities(db, days=90, batch_size=3)
+
+        assert deleted_count == 7
+        assert get_activity_by_id(db, loaded.id) is None
+        activities = get_activities_by_user(db, user.id)
+        assert [a.action_type for a in activities] == ["recent_action"]
+
+
+# ============================================================================
+# Activity Write Buffer Tests
+# ============================================================================
+
+class TestActivityWriteBuffer:
+    """ActivityWriteBuffer 배치 쓰기 테스트"""
+
+    def test_flush_writes_queued_activities(self, db):
+        """flush 시 큐에 쌓인 활동이 모두 저장되는지 확인"""
+        user = create_test_user(db, username="bufferuser", email="buffer@example.com")
+        buffer = ActivityWriteBuffer(session_factory=buffer_session_factory(db), batch_size=2)
+
+        for i in range(5):
+            buffer.put(user.id, "click", f"Click {i}", {"index": i})
+
+        # flush 전에는 저장되지 않음
+        assert get_activities_by_user(db, user.id) == []
+
+        written = buffer.flush()
+
+        assert written == 5
+        activities = get_activities_by_user(db, user.id)
+        assert len(activities) == 5
+        assert {a.extra_data["index"] for a in activities} == set(range(5))
+        assert all(a.created_at is not None for a in activities)
+
+    def test_flush_empty_queue(self, db):
+        """큐가 비어있으면 0 반환"""
+        buffer = ActivityWriteBuffer(session_factory=buffer_session_factory(db))
+
+        assert buffer.flush() == 0
+
+    def test_flush_keeps_valid_records_when_one_fails(self, db, caplog):
+        """배치 중 한 건이 실패해도 나머지 기록은 저장되고 오류는 로그에 남는지 확인"""
+        user = create_test_user(db, username="baduser", email="bad@example.com")
+        buffer = ActivityWriteBuffer(session_factory=buffer_session_factory(db))
+
+        for i in range(5):
+            buffer.put(user.id, "click", f"Click {i}")
+        # datetime은 JSON 컬럼에 직렬화할 수 없어 INSERT가 실패함
+        buffer.put(user.id, "click", "Bad", {"at": datetime.utcnow()})
+
+        with caplog.at_level(logging.ERROR, logger="app.crud.activity"):
+            written = buffer.flush()
+
+        assert written == 5
+        assert len(get_activities_by_user(db, user.id)) == 5
+        messages = [record.getMessage() for record in caplog.records]
+        assert "Failed to write activity batch of 6 records" in messages[0]
+        assert messages[1] == f"Dropping activity record for user_id={user.id}"
+
+    def test_put_flushes_full_queue_without_thread(self, db):
+        """스레드가 없을 때 큐가 가득 차면 put이 먼저 저장하여 기록을 잃지 않음"""
+        user = create_test_user(db, username="fulluser", email="full@example.com")
+        buffer = ActivityWriteBuffer(
+            session_factory=buffer_session_factory(db), max_queue_size=3
+        )
+
+        for i in range(4):
+            buffer.put(user.id, "click", f"Click {i}")
+
+        assert len(get_activities_by_user(db, user.id)) == 3
+        assert buffer.flush() == 1
+        assert len(get_activities_by_user(db, user.id)) == 4
+
+    def test_background_thread_writes_and_stop_flushes(self, tmp_path):
+        """백그라운드 스레드 저장 및 stop 시 남은 기록 저장 확인"""
+        # 백그라운드 스레드와의 공유를 위해 파일 기반 SQLite 사용
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'buffer.db'}",
+            connect_args={"check_same_thread": False}
+        )
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine)
+
+        db = session_factory()
+        user = create_test_user(db, username="threaduser", email="thread@example.com")
+
+        buffer = ActivityWriteBuffer(session_factory=session_factory, flush_interval=0.01)
+        buffer.start()
+        for i in range(10):
+            buffer.put(user.id, "query", f"Query {i}")
+        buffer.stop()
+
+        assert len(get_activities_by_user(db, user.id)) == 10
+
+        db.close()
+        engine.dispose()
+
 
 # ============================================================================
 # Cascade Delete Test
@@ -0,0 +1,328 @@
+"""
+활동 로깅 유틸리티 테스트
+
+테스트 항목:
+- log_activity 데코레이터 (동기/비동기) 활동 기록 (배치 쓰기 버퍼 경유)
+- include_args 인자 직렬화
+- db/current_user가 없을 때 기록 생략
+- 시그니처 분석은 데코레이션 시점 1회
+- ActivityLogger.log_many 일괄 기록
+"""
+
+import asyncio
+import inspect
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.crud import activity as activity_crud
+from app.crud.activity import ActivityWriteBuffer
+from app.crud.user import create_user
+from app.models.activity import Activity
+from app.models.user import User
+from app.utils import activity_logger
+from app.utils.activity_logger import ActivityLogger, log_activity
+
+
+@pytest.fixture
+def user(db) -> User:
+    """테스트용 사용자 픽스처"""
+    return create_user(
+        db=db,
+        username="loguser",
+        email="log@example.com",
+        password_hash="hashed_password_123",
+    )
+
+
+@pytest.fixture(autouse=True)
+def write_buffer(db, monkeypatch) -> ActivityWriteBuffer:
+    """
+    전역 배치 쓰기 버퍼를 테스트 DB에 저장하는 버퍼로 교체
+
+    버퍼의 commit/rollback은 테스트의 바깥 트랜잭션이 아닌 SAVEPOINT 단위로만 동작합니다.
+    """
+    session_factory = sessionmaker(
+        bind=db.get_bind(), join_transaction_mode="create_savepoint"
+    )
+    buffer = ActivityWriteBuffer(session_factory=session_factory)
+    monkeypatch.setattr(activity_crud, "activity_write_buffer", buffer)
+    return buffer
+
+
+def get_logged_activities(db: Session) -> list:
+    """버퍼를 flush한 뒤 기록된 활동 목록 조회 헬퍼"""
+    activity_crud.activity_write_buffer.flush()
+    return db.query(Activity).order_by(Activity.id).all()
+
+
+class TestLogActivityDecorator:
+    """log_activity 데코레이터 테스트"""
+
+    def test_sync_function_logs_activity(self, db, user):
+        """동기 함수 호출 시 활동 기록"""
+        @log_activity(action_type="view_item", description="Viewed item")
+        def view_item(item_id: int, db: Session, current_user: User):
+            return item_id
+
+        result = view_item(7, db=db, current_user=user)
+
+        activities = get_logged_activities(db)
+        assert result == 7
+        assert len(activities) == 1
+        assert activities[0].user_id == user.id
+        assert activities[0].action_type == "view_item"
+        assert activities[0].description == "Viewed item"
+        assert activities[0].extra_data is None
+
+    def test_async_function_logs_activity(self, db, user):
+        """비동기 함수 호출 시 활동 기록, 기본 action_type은 함수 이름"""
+        @log_activity()
+        async def fetch_item(item_id: int, db: Session, current_user: User):
+            return item_id
+
+        assert inspect.iscoroutinefunction(fetch_item)
+
+        result = asyncio.run(fetch_item(3, db, user))
+
+        activities = get_logged_activities(db)
+        assert result == 3
+        assert len(activities) == 1
+        assert activities[0].action_type == "fetch_item"
+
+    def test_wrapper_kind_matches_function(self):
+        """동기 함수는 동기 래퍼, 비동기 함수는 비동기 래퍼로 감싸짐"""
+        @log_activity()
+        def sync_func():
+            return None
+
+        @log_activity()
+        async def async_func():
+            return None
+
+        assert not inspect.iscoroutinefunction(sync_func)
+        assert inspect.iscoroutinefunction(async_func)
+        assert sync_func.__wrapped__.__name__ == "sync_func"
+        assert async_func.__wrapped__.__name__ == "async_func"
+
+    def test_include_args_serializes_arguments(self, db, user):
+        """include_args=True면 민감 인자를 제외하고 extra_data에 포함"""
+        @log_activity(action_type="update", include_args=True)
+        def update_item(
+            item_id: int,
+            tags: list,
+            password: str,
+            db: Session,
+            current_user: User,
+            note: str = "default",
+        ):
+            return None
+
+        update_item(5, ["a", 1], "secret", db=db, current_user=user)
+
+        activities = get_logged_activities(db)
+        assert activities[0].extra_data == {
+            "item_id": 5,
+            "tags": ["a", 1],
+            "note": "default",
+        }
+
+    def test_missing_current_user_skips_logging(self, db):
+        """current_user가 없으면 활동을 기록하지 않음"""
+        @log_activity(action_type="anonymous")
+        def anonymous_call(db: Session):
+            return "ok"
+
+        assert anonymous_call(db=db) == "ok"
+        assert get_logged_activities(db) == []
+
+    def test_signature_computed_once_at_decoration(self, db, user, monkeypatch):
+        """시그니처는 데코레이션 시점에 한 번만 분석"""
+        calls = []
+        original_signature = inspect.signature
+
+        def counting_signature(func, *args, **kwargs):
+            calls.append(func)
+            return original_signature(func, *args, **kwargs)
+
+        monkeypatch.setattr(activity_logger.inspect, "signature", counting_signature)
+
+        @log_activity(action_type="repeat")
+        def repeat(db: Session, current_user: User):
+            return None
+
+        for _ in range(3):
+            repeat(db=db, current_user=user)
+
+        assert len(calls) == 1
+        assert len(get_logged_activities(db)) == 3
+
+    def test_does_not_use_request_session(self, db, user, write_buffer):
+        """요청의 db 세션으로 INSERT하지 않고 버퍼에만 추가"""
+        @log_activity(action_type="buffered")
+        def buffered(db: Session, current_user: User):
+            return None
+
+        buffered(db=db, current_user=user)
+
+        assert len(db.new) == 0
+        assert db.query(Activity).count() == 0
+        assert write_buffer.flush() == 1
+        assert db.query(Activity).count() == 1
+
+    def test_positional_db_and_user_without_bind(self, db, user, monkeypatch):
+        """위치 인자로 전달된 db/current_user도 Signature.bind 없이 추출"""
+        def fail_bind(*args, **kwargs):
+            raise AssertionError("Signature.bind should not be called")
+
+        monkeypatch.setattr(inspect.Signature, "bind", fail_bind)
+
+        @log_activity(action_type="positional")
+        def positional(db: Session, current_user: User):
+            return None
+
+        positional(db, user)
+
+        activities = get_logged_activities(db)
+        assert len(activities) == 1
+        assert activities[0].action_type == "positional"
+
+
+class TestActivityLogger:
+    """ActivityLogger 헬퍼 테스트"""
+
+    def test_log_login_extra_data(self, db, user):
+        """log_login은 값이 있는 필드만 extra_data에 포함, 없으면 None"""
+        with_ip = ActivityLogger.log_login(db, user.id, ip_address="10.0.0.1")
+        without_info = ActivityLogger.log_login(db, user.id)
+
+        assert with_ip.extra_data == {"ip_address": "10.0.0.1"}
+        assert without_info.extra_data is None
+
+    def test_log_api_call_extra_data(self, db, user):
+        """log_api_call은 status_code가 있을 때만 포함"""
+        with_status = ActivityLogger.log_api_call(db, user.id, "/api/items", "GET", 200)
+        without_status = ActivityLogger.log_api_call(db, user.id, "/api/items", "POST")
+
+        assert with_status.description == "GET /api/items"
+        assert with_status.extra_data == {
+            "endpoint": "/api/items",
+            "method": "GET",
+            "status_code": 200,
+        }
+        assert without_status.extra_data == {"endpoint": "/api/items", "method": "POST"}
+
+    def test_log_error_extra_data(self, db, user):
+        """log_error는 traceback이 있을 때만 포함"""
+        with_traceback = ActivityLogger.log_error(
+            db, user.id, "ValueError", "bad", traceback_info="line 1"
+        )
+        without_traceback = ActivityLogger.log_error(db, user.id, "ValueError", "bad")
+
+        assert with_traceback.description == "ValueError: bad"
+        assert with_traceback.extra_data["traceback"] == "line 1"
+        assert without_traceback.extra_data == {
+            "error_type": "ValueError",
+            "error_message": "bad",
+        }
+
+    def test_missing_user_id_skips_without_query(self, db):
+        """user_id가 없으면 DB 접근 없이 None 반환, log_many는 해당 기록 제외"""
+        assert ActivityLogger.log_login(db, user_id=None) is None
+        assert ActivityLogger.log_api_call(db, 0, "/api", "GET") is None
+        assert ActivityLogger.log_error(db, None, "ValueError", "bad") is None
+        assert ActivityLogger.log_many(db, [{"user_id": None, "action_type": "x"}]) == 0
+        assert db.query(Activity).count() == 0
+
+    def test_db_errors_are_not_swallowed(self, db, monkeypatch):
+        """DB 저장 실패는 조용히 무시하지 않고 호출자에게 전달"""
+        def fail(**kwargs):
+            raise SQLAlchemyError("insert failed")
+
+        monkeypatch.setattr(activity_logger, "create_activity", fail)
+
+        with pytest.raises(SQLAlchemyError):
+            ActivityLogger.log_login(db, user_id=1)
+
+    def test_has_no_instance_dict(self):
+        """정적 메서드 전용 클래스는 인스턴스 __dict__를 만들지 않음"""
+        assert not hasattr(ActivityLogger(), "__dict__")
+
+    def test_log_many_writes_all_records(self, db, user):
+        """log_many는 모든 기록을 한 번에 저장"""
+        count = ActivityLogger.log_many(db, [
+            {"user_id": user.id, "action_type": "login"},
+            {"user_id": user.id, "action_type": "api_call", "description": "GET /api"},
+        ])
+
+        activities = db.query(Activity).order_by(Activity.id).all()
+        assert count == 2
+        assert [a.action_type for a in activities] == ["login", "api_call"]
+
+
+class TestSerializeArgs:
+    """_serialize_args 직렬화 테스트"""
+
+    def test_serializes_by_type(self):
+        """기본 타입은 그대로, 컨테이너 원소와 기타 객체는 문자열로 변환"""
+        class Marker:
+            def __str__(self):
+                return "marker"
+
+        result = activity_logger._serialize_args({
+            "text": "a",
+            "count": 1,
+            "ratio": 0.5,
+            "flag": True,
+            "empty": None,
+            "items": ("x", 2, Marker()),
+            "mapping": {"k": Marker(), "n": 3},
+            "obj": Marker(),
+            "password": "secret",
+            "db": object(),
+        })
+
+        assert result == {
+            "text": "a",
+            "count": 1,
+            "ratio": 0.5,
+            "flag": True,
+            "empty": None,
+            "items": ["x", 2, "marker"],
+            "mapping": {"k": "marker", "n": 3},
+            "obj": "marker",
+        }
+
+    def test_pydantic_model_is_json_safe(self):
+        """Pydantic 모델의 datetime 필드는 JSON 호환 문자열로 변환"""
+        class Event(BaseModel):
+            name: str
+            at: datetime
+
+        result = activity_logger._serialize_args({
+            "event": Event(name="launch", at=datetime(2024, 1, 2, 3, 4, 5)),
+        })
+
+        assert result == {"event": {"name": "launch", "at": "2024-01-02T03:04:05"}}
+
+
+class TestLogSpec:
+    """_LogSpec 데코레이션 시점 메타데이터 테스트"""
+
+    def test_spec_precomputes_metadata(self):
+        """action_type 기본값, 인자 인덱스, 기본값을 미리 계산"""
+        def handler(item_id: int, current_user=None, *, db=None):
+            return None
+
+        spec = activity_logger._LogSpec(handler, None, "desc", True)
+
+        assert spec.action_type == "handler"
+        assert spec.description == "desc"
+        assert spec.include_args is True
+        assert spec.arg_indices == {"item_id": 0, "current_user": 1}
+        assert spec.defaults == {"current_user": None, "db": None}
+        assert spec.user_index == 1
+        assert not hasattr(spec, "__dict__")
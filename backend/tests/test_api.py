@@ -5,54 +5,9 @@ Health check, Examples API 및 기타 API 엔드포인트를 테스트합니다.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-
-from app.main import app
-from app.database import Base, get_db
-# 모델 임포트 - 테이블 생성을 위해 필요
-from app.models import Example, User  # noqa: F401
-
-
-# 테스트용 인메모리 SQLite DB 설정
-TEST_DATABASE_URL = "sqlite:///:memory:"
-test_engine = create_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,  # 인메모리 DB에서 동일한 연결 유지
-)
-TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-
-
-def override_get_db():
-    """테스트용 DB 세션 의존성 오버라이드"""
-    db = TestSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-@pytest.fixture(autouse=True)
-def setup_test_db():
-    """각 테스트 전후로 DB 테이블 생성/삭제 및 의존성 오버라이드"""
-    # DB 의존성 오버라이드 설정
-    app.dependency_overrides[get_db] = override_get_db
-    # 테이블 생성
-    Base.metadata.create_all(bind=test_engine)
-    yield
-    # 테이블 삭제
-    Base.metadata.drop_all(bind=test_engine)
-    # 의존성 오버라이드 해제
-    app.dependency_overrides.clear()
-
-
-@pytest.fixture
-def client():
-    """테스트용 HTTP 클라이언트 픽스처"""
-    return TestClient(app)
+
+# 각 테스트는 conftest의 override_get_db로 롤백되는 트랜잭션 안에서 실행
+pytestmark = pytest.mark.usefixtures("override_get_db")
 
 
 class TestHealthCheckEndpoint:
@@ -82,6 +37,16 @@ class TestHealthCheckEndpoint:
         data = response.json()
         assert "FastAPI" in data["message"]
 
+    def test_health_check_json_headers_stable(self, client):
+        """반복 호출해도 JSON 응답 헤더가 누적되지 않음"""
+        origin = {"Origin": "http://localhost:3000"}
+        first = client.get("/api/health", headers=origin)
+        second = client.get("/api/health", headers=origin)
+
+        assert second.headers["content-type"] == "application/json"
+        assert second.headers.raw == first.headers.raw
+        assert second.json() == first.json()
+
 
 class TestNotFoundEndpoint:
     """존재하지 않는 엔드포인트 테스트"""
@@ -207,36 +172,33 @@ class TestExamplesAPI:
 class TestCORSHeaders:
     """CORS 헤더 검증 테스트"""
 
-    def test_cors_headers_on_get_request(self, client):
-        """GET 요청에 CORS 헤더가 포함되는지 확인"""
-        response = client.get(
-            "/api/health",
-            headers={"Origin": "http://localhost:3000"}
-        )
-        assert response.headers.get("access-control-allow-origin") == "http://localhost:3000"
+    @pytest.mark.parametrize(
+        "method, path, request_kwargs",
+        [
+            pytest.param("get", "/api/health", {}, id="get"),
+            pytest.param("post", "/api/examples/", {"json": {"name": "CORS Test"}}, id="post"),
+            pytest.param(
+                "options",
+                "/api/examples/",
+                {"headers": {
+                    "Access-Control-Request-Method": "POST",
+                    "Access-Control-Request-Headers": "Content-Type",
+                }},
+                id="preflight",
+            ),
+        ],
+    )
+    def test_cors_headers(self, client, method, path, request_kwargs):
+        """GET/POST 요청과 OPTIONS preflight 응답에 CORS 헤더가 포함되는지 확인"""
+        request_kwargs = dict(request_kwargs)
+        headers = {"Origin": "http://localhost:3000", **request_kwargs.pop("headers", {})}
+
+        response = getattr(client, method)(path, headers=headers, **request_kwargs)
 
-    def test_cors_headers_on_post_request(self, client):
-        """POST 요청에 CORS 헤더가 포함되는지 확인"""
-        response = client.post(
-            "/api/examples/",
-            json={"name": "CORS Test"},
-            headers={"Origin": "http://localhost:3000"}
-        )
-        assert response.headers.get("access-control-allow-origin") == "http://localhost:3000"
-
-    def test_preflight_request(self, client):
-        """OPTIONS preflight 요청 처리 확인"""
-        response = client.options(
-            "/api/examples/",
-            headers={
-                "Origin": "http://localhost:3000",
-                "Access-Control-Request-Method": "POST",
-                "Access-Control-Request-Headers": "Content-Type",
-            }
-        )
         assert response.status_code == 200
         assert response.headers.get("access-control-allow-origin") == "http://localhost:3000"
-        assert "POST" in response.headers.get("access-control-allow-methods", "")
+        if method == "options":
+            assert "POST" in response.headers.get("access-control-allow-methods", "")
 
 
 class TestDatabaseConnection:
@@ -272,5 +234,5 @@ class TestDatabaseConnection:
         """테스트 간 DB가 격리되는지 확인 (이 테스트는 비어있어야 함)"""
         response = client.get("/api/examples/")
         assert response.status_code == 200
-        # setup_test_db 픽스처가 각 테스트 전에 DB를 초기화하므로 비어있어야 함
+        # override_get_db 픽스처가 각 테스트 후 트랜잭션을 롤백하므로 비어있어야 함
         assert response.json() == []
@@ -4,56 +4,23 @@
 회원가입, 로그인, 사용자 정보 조회 등 인증 관련 API의 전체 플로우를 검증합니다.
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-
-from app.main import app
-from app.database import Base, get_db
-# 모델 임포트 - 테이블 생성을 위해 필요
-from app.models import Example, User  # noqa: F401
-
-
-# 테스트용 인메모리 SQLite DB 설정
-TEST_DATABASE_URL = "sqlite:///:memory:"
-test_engine = create_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,  # 인메모리 DB에서 동일한 연결 유지
-)
-TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-
-
-def override_get_db():
-    """테스트용 DB 세션 의존성 오버라이드"""
-    db = TestSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-@pytest.fixture(autouse=True)
-def setup_test_db():
-    """각 테스트 전후로 DB 테이블 생성/삭제 및 의존성 오버라이드"""
-    # DB 의존성 오버라이드 설정
-    app.dependency_overrides[get_db] = override_get_db
-    # 테이블 생성
-    Base.metadata.create_all(bind=test_engine)
-    yield
-    # 테이블 삭제
-    Base.metadata.drop_all(bind=test_engine)
-    # 의존성 오버라이드 해제
-    app.dependency_overrides.clear()
+from fastapi import Request
 
+from app.dependencies import get_current_user
+from app.models import User
+
+
+# 각 테스트는 conftest의 override_get_db로 롤백되는 트랜잭션 안에서 실행
+pytestmark = pytest.mark.usefixtures("override_get_db")
 
-@pytest.fixture
-def client():
-    """테스트용 HTTP 클라이언트 픽스처"""
-    return TestClient(app)
 
+# 인증 API 경로
+REGISTER_URL = "/api/auth/register"
+LOGIN_URL = "/api/auth/login"
+ME_URL = "/api/auth/me"
 
 # 테스트에 사용할 유효한 사용자 데이터
 VALID_USER_DATA = {
@@ -63,6 +30,35 @@ VALID_USER_DATA = {
 }
 
 
+# 여러 사용자 시나리오에 사용할 사용자 데이터
+MULTI_USER_DATA = [
+    {"username": "user1", "email": "user1@example.com", "password": "password123"},
+    {"username": "user2", "email": "user2@example.com", "password": "password456"},
+    {"username": "user3", "email": "user3@example.com", "password": "password789"},
+]
+
+
+def bearer_headers(token: str) -> dict:
+    """Authorization: Bearer 헤더 생성 헬퍼"""
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def registered_users(client) -> list:
+    """
+    MULTI_USER_DATA의 사용자를 모두 회원가입시키는 픽스처
+
+    Returns:
+        (사용자 데이터, access_token) 튜플 리스트
+    """
+    users = []
+    for user_data in MULTI_USER_DATA:
+        response = client.post(REGISTER_URL, json=user_data)
+        assert response.status_code == 201
+        users.append((user_data, response.json()["access_token"]))
+    return users
+
+
 class TestRegisterEndpoint:
     """회원가입 엔드포인트 테스트"""
 
@@ -75,7 +71,7 @@ class TestRegisterEndpoint:
         - 201 Created 상태 코드 확인
         - access_token, token_type 반환 확인
         """
-        response = client.post("/api/auth/register", json=VALID_USER_DATA)
+        response = client.post(REGISTER_URL, json=VALID_USER_DATA)
 
         assert response.status_code == 201
         data = response.json()
@@ -83,85 +79,74 @@ class TestRegisterEndpoint:
         assert data["token_type"] == "bearer"
         assert len(data["access_token"]) > 0
 
-    def test_register_duplicate_email_failure(self, client):
-        """
-        중복 email 회원가입 실패 테스트
-
-        - 사용자 1 생성
-        - 동일한 email로 사용자 2 생성 시도
-        - 400 Bad Request 확인
-        - 에러 메시지: "Email already registered"
+    @pytest.mark.parametrize(
+        "register_first, payload, expected_status, expected_detail",
+        [
+            pytest.param(
+                True,
+                {
+                    "username": "differentuser",
+                    "email": "test@example.com",  # 동일한 email
+                    "password": "anotherpassword123"
+                },
+                400,
+                "Email already registered",
+                id="duplicate_email",
+            ),
+            pytest.param(
+                True,
+                {
+                    "username": "testuser",  # 동일한 username
+                    "email": "different@example.com",
+                    "password": "anotherpassword123"
+                },
+                400,
+                "Username already taken",
+                id="duplicate_username",
+            ),
+            pytest.param(
+                False,
+                {
+                    "username": "testuser",
+                    "email": "notanemail",  # 유효하지 않은 email 형식
+                    "password": "securepassword123"
+                },
+                422,
+                None,
+                id="invalid_email",
+            ),
+            pytest.param(
+                False,
+                {
+                    "username": "testuser",
+                    "email": "test@example.com",
+                    "password": "short"  # 8자 미만 비밀번호
+                },
+                422,
+                None,
+                id="short_password",
+            ),
+        ],
+    )
+    def test_register_failure(
+        self, client, register_first, payload, expected_status, expected_detail
+    ):
         """
-        # 첫 번째 사용자 생성
-        client.post("/api/auth/register", json=VALID_USER_DATA)
-
-        # 동일한 email로 두 번째 사용자 생성 시도
-        duplicate_email_user = {
-            "username": "differentuser",
-            "email": "test@example.com",  # 동일한 email
-            "password": "anotherpassword123"
-        }
-        response = client.post("/api/auth/register", json=duplicate_email_user)
-
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"] == "Email already registered"
+        회원가입 실패 테스트
 
-    def test_register_duplicate_username_failure(self, client):
+        - duplicate_email / duplicate_username: 사용자 1 생성 후
+          동일한 email 또는 username으로 가입 시도 시 400 및 에러 메시지 확인
+        - invalid_email / short_password: 형식이 잘못된 입력은 422 확인
         """
-        중복 username 회원가입 실패 테스트
+        if register_first:
+            # 첫 번째 사용자 생성
+            client.post(REGISTER_URL, json=VALID_USER_DATA)
 
-        - 사용자 1 생성
-        - 동일한 username으로 사용자 2 생성 시도
-        - 400 Bad Request 확인
-        - 에러 메시지: "Username already taken"
-        """
-        # 첫 번째 사용자 생성
-        client.post("/api/auth/register", json=VALID_USER_DATA)
-
-        # 동일한 username으로 두 번째 사용자 생성 시도
-        duplicate_username_user = {
-            "username": "testuser",  # 동일한 username
-            "email": "different@example.com",
-            "password": "anotherpassword123"
-        }
-        response = client.post("/api/auth/register", json=duplicate_username_user)
+        response = client.post(REGISTER_URL, json=payload)
 
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"] == "Username already taken"
-
-    def test_register_invalid_email_failure(self, client):
-        """
-        유효하지 않은 email 회원가입 실패 테스트
-
-        - 잘못된 형식의 email (예: "notanemail")
-        - 422 Unprocessable Entity 확인
-        """
-        invalid_email_user = {
-            "username": "testuser",
-            "email": "notanemail",  # 유효하지 않은 email 형식
-            "password": "securepassword123"
-        }
-        response = client.post("/api/auth/register", json=invalid_email_user)
-
-        assert response.status_code == 422
-
-    def test_register_short_password_failure(self, client):
-        """
-        짧은 비밀번호 회원가입 실패 테스트
-
-        - password가 8자 미만 (예: "short")
-        - 422 Unprocessable Entity 확인
-        """
-        short_password_user = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "short"  # 8자 미만 비밀번호
-        }
-        response = client.post("/api/auth/register", json=short_password_user)
-
-        assert response.status_code == 422
+        assert response.status_code == expected_status
+        if expected_detail is not None:
+            assert response.json()["detail"] == expected_detail
 
 
 class TestLoginEndpoint:
@@ -178,14 +163,14 @@ class TestLoginEndpoint:
         - access_token, token_type 반환 확인
         """
         # 먼저 회원가입
-        client.post("/api/auth/register", json=VALID_USER_DATA)
+        client.post(REGISTER_URL, json=VALID_USER_DATA)
 
         # 로그인
         login_data = {
             "email": VALID_USER_DATA["email"],
             "password": VALID_USER_DATA["password"]
         }
-        response = client.post("/api/auth/login", json=login_data)
+        response = client.post(LOGIN_URL, json=login_data)
 
         assert response.status_code == 200
         data = response.json()
@@ -193,42 +178,35 @@ class TestLoginEndpoint:
         assert data["token_type"] == "bearer"
         assert len(data["access_token"]) > 0
 
-    def test_login_wrong_password_failure(self, client):
+    @pytest.mark.parametrize(
+        "register_first, login_data",
+        [
+            pytest.param(
+                True,
+                {"email": VALID_USER_DATA["email"], "password": "wrongpassword123"},
+                id="wrong_password",
+            ),
+            pytest.param(
+                False,
+                {"email": "nonexistent@example.com", "password": "somepassword123"},
+                id="nonexistent_user",
+            ),
+        ],
+    )
+    def test_login_failure(self, client, register_first, login_data):
         """
-        잘못된 비밀번호 로그인 실패 테스트
+        로그인 실패 테스트
 
-        - 사용자 생성
-        - 틀린 비밀번호로 로그인 시도
+        - wrong_password: 사용자 생성 후 틀린 비밀번호로 로그인 시도
+        - nonexistent_user: 존재하지 않는 email로 로그인 시도
         - 401 Unauthorized 확인
-        - 에러 메시지: "Incorrect email or password"
+        - 에러 메시지: "Incorrect email or password" (계정 존재 여부 노출 방지)
         """
-        # 먼저 회원가입
-        client.post("/api/auth/register", json=VALID_USER_DATA)
+        if register_first:
+            # 먼저 회원가입
+            client.post(REGISTER_URL, json=VALID_USER_DATA)
 
-        # 틀린 비밀번호로 로그인 시도
-        wrong_password_login = {
-            "email": VALID_USER_DATA["email"],
-            "password": "wrongpassword123"
-        }
-        response = client.post("/api/auth/login", json=wrong_password_login)
-
-        assert response.status_code == 401
-        data = response.json()
-        assert data["detail"] == "Incorrect email or password"
-
-    def test_login_nonexistent_user_failure(self, client):
-        """
-        존재하지 않는 사용자 로그인 실패 테스트
-
-        - 존재하지 않는 email로 로그인 시도
-        - 401 Unauthorized 확인
-        - 에러 메시지: "Incorrect email or password"
-        """
-        nonexistent_user_login = {
-            "email": "nonexistent@example.com",
-            "password": "somepassword123"
-        }
-        response = client.post("/api/auth/login", json=nonexistent_user_login)
+        response = client.post(LOGIN_URL, json=login_data)
 
         assert response.status_code == 401
         data = response.json()
@@ -248,13 +226,13 @@ class TestMeEndpoint:
         - 사용자 정보 반환 확인 (id, username, email, created_at)
         """
         # 회원가입으로 토큰 받기
-        register_response = client.post("/api/auth/register", json=VALID_USER_DATA)
+        register_response = client.post(REGISTER_URL, json=VALID_USER_DATA)
         token = register_response.json()["access_token"]
 
         # /me 엔드포인트 호출
         response = client.get(
-            "/api/auth/me",
-            headers={"Authorization": f"Bearer {token}"}
+            ME_URL,
+            headers=bearer_headers(token)
         )
 
         assert response.status_code == 200
@@ -264,31 +242,41 @@ class TestMeEndpoint:
         assert data["email"] == VALID_USER_DATA["email"]
         assert "created_at" in data
 
-    def test_get_me_without_token_failure(self, client):
+    @pytest.mark.parametrize(
+        "headers, expected_statuses",
+        [
+            # HTTPBearer는 Authorization 헤더가 없으면 403 Forbidden 반환
+            pytest.param({}, (401, 403), id="without_token"),
+            pytest.param(bearer_headers("invalid_token_here"), (401,), id="invalid_token"),
+        ],
+    )
+    def test_get_me_failure(self, client, headers, expected_statuses):
         """
-        인증 없이 /me 접근 실패 테스트
+        인증 실패 시 /me 접근 실패 테스트
 
-        - Authorization 헤더 없이 GET /api/auth/me
-        - 401 Unauthorized 또는 403 Forbidden 확인
+        - without_token: Authorization 헤더 없이 GET /api/auth/me (401 또는 403)
+        - invalid_token: 잘못된 토큰으로 GET /api/auth/me (401)
         """
-        response = client.get("/api/auth/me")
+        response = client.get(ME_URL, headers=headers)
 
-        # HTTPBearer는 Authorization 헤더가 없으면 403 Forbidden 반환
-        assert response.status_code in [401, 403]
+        assert response.status_code in expected_statuses
 
-    def test_get_me_with_invalid_token_failure(self, client):
+    def test_get_current_user_reuses_request_state(self):
         """
-        유효하지 않은 토큰으로 /me 접근 실패 테스트
+        같은 요청 내에서 request.state.user가 있으면 토큰/DB 조회 없이 재사용
 
-        - 잘못된 토큰으로 GET /api/auth/me
-        - 401 Unauthorized 확인
+        - request.state.user에 사용자를 미리 저장
+        - 유효하지 않은 토큰과 db=None으로 호출해도 저장된 사용자 반환
         """
-        response = client.get(
-            "/api/auth/me",
-            headers={"Authorization": "Bearer invalid_token_here"}
+        request = Request({"type": "http", "headers": []})
+        user = User(id=1, username="stateuser", email="state@example.com")
+        request.state.user = user
+
+        result = asyncio.run(
+            get_current_user(request=request, token="invalid_token_here", db=None)
         )
 
-        assert response.status_code == 401
+        assert result is user
 
 
 class TestAuthIntegrationFlow:
@@ -304,7 +292,7 @@ class TestAuthIntegrationFlow:
         - 전체 플로우가 정상 동작하는지 확인
         """
         # 1. 회원가입
-        register_response = client.post("/api/auth/register", json=VALID_USER_DATA)
+        register_response = client.post(REGISTER_URL, json=VALID_USER_DATA)
         assert register_response.status_code == 201
         register_token = register_response.json()["access_token"]
         assert len(register_token) > 0
@@ -314,15 +302,15 @@ class TestAuthIntegrationFlow:
             "email": VALID_USER_DATA["email"],
             "password": VALID_USER_DATA["password"]
         }
-        login_response = client.post("/api/auth/login", json=login_data)
+        login_response = client.post(LOGIN_URL, json=login_data)
         assert login_response.status_code == 200
         login_token = login_response.json()["access_token"]
         assert len(login_token) > 0
 
         # 3. 회원가입 토큰으로 /me 접근
         me_response_with_register_token = client.get(
-            "/api/auth/me",
-            headers={"Authorization": f"Bearer {register_token}"}
+            ME_URL,
+            headers=bearer_headers(register_token)
         )
         assert me_response_with_register_token.status_code == 200
         user_data = me_response_with_register_token.json()
@@ -331,8 +319,8 @@ class TestAuthIntegrationFlow:
 
         # 4. 로그인 토큰으로 /me 접근 (동일한 사용자 정보 반환)
         me_response_with_login_token = client.get(
-            "/api/auth/me",
-            headers={"Authorization": f"Bearer {login_token}"}
+            ME_URL,
+            headers=bearer_headers(login_token)
         )
         assert me_response_with_login_token.status_code == 200
         user_data_login = me_response_with_login_token.json()
@@ -342,59 +330,29 @@ class TestAuthIntegrationFlow:
         assert user_data_login["username"] == user_data["username"]
         assert user_data_login["email"] == user_data["email"]
 
-    def test_multiple_users_registration(self, client):
+    def test_multiple_users_registration(self, client, registered_users):
         """
         여러 사용자 회원가입 테스트
 
         - 여러 사용자를 생성하고 각각 고유한 정보를 가지는지 확인
         """
-        users = [
-            {"username": "user1", "email": "user1@example.com", "password": "password123"},
-            {"username": "user2", "email": "user2@example.com", "password": "password456"},
-            {"username": "user3", "email": "user3@example.com", "password": "password789"},
-        ]
-
-        tokens = []
-        for user_data in users:
-            response = client.post("/api/auth/register", json=user_data)
-            assert response.status_code == 201
-            tokens.append(response.json()["access_token"])
-
         # 각 토큰으로 /me 접근하여 올바른 사용자 정보 반환 확인
-        for i, token in enumerate(tokens):
-            response = client.get(
-                "/api/auth/me",
-                headers={"Authorization": f"Bearer {token}"}
-            )
+        for user_data, token in registered_users:
+            response = client.get(ME_URL, headers=bearer_headers(token))
             assert response.status_code == 200
             data = response.json()
-            assert data["username"] == users[i]["username"]
-            assert data["email"] == users[i]["email"]
+            assert data["username"] == user_data["username"]
+            assert data["email"] == user_data["email"]
 
-    def test_token_from_different_user_returns_different_data(self, client):
+    def test_token_from_different_user_returns_different_data(self, client, registered_users):
         """
         다른 사용자의 토큰으로 다른 사용자 정보가 반환되는지 확인
         """
-        # 첫 번째 사용자 생성
-        user1_data = {"username": "user1", "email": "user1@example.com", "password": "password123"}
-        user1_response = client.post("/api/auth/register", json=user1_data)
-        user1_token = user1_response.json()["access_token"]
-
-        # 두 번째 사용자 생성
-        user2_data = {"username": "user2", "email": "user2@example.com", "password": "password456"}
-        user2_response = client.post("/api/auth/register", json=user2_data)
-        user2_token = user2_response.json()["access_token"]
+        (_, user1_token), (_, user2_token) = registered_users[:2]
 
         # 각 토큰으로 /me 접근
-        user1_me = client.get(
-            "/api/auth/me",
-            headers={"Authorization": f"Bearer {user1_token}"}
-        ).json()
-
-        user2_me = client.get(
-            "/api/auth/me",
-            headers={"Authorization": f"Bearer {user2_token}"}
-        ).json()
+        user1_me = client.get(ME_URL, headers=bearer_headers(user1_token)).json()
+        user2_me = client.get(ME_URL, headers=bearer_headers(user2_token)).json()
 
         # 서로 다른 사용자 정보여야 함
         assert user1_me["id"] != user2_me["id"]
@@ -0,0 +1,121 @@
+"""
+인증 유틸리티 테스트
+
+테스트 항목:
+- 비밀번호 해싱 및 검증
+- JWT 토큰 생성 및 디코드
+- 디코드된 JWT 페이로드 캐시
+"""
+
+import time
+from datetime import timedelta
+
+import pytest
+from jwt import PyJWTError as JWTError
+
+from app.utils import auth
+from app.utils.auth import (
+    hash_password,
+    verify_password,
+    create_access_token,
+    decode_access_token,
+    clear_token_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_token_cache():
+    """각 테스트 전후로 JWT 페이로드 캐시 초기화"""
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+class TestPasswordHashing:
+    """비밀번호 해싱 테스트"""
+
+    def test_hash_and_verify_password(self):
+        """해싱한 비밀번호가 원문으로 검증되는지 확인"""
+        hashed = hash_password("securepassword123")
+
+        assert hashed != "securepassword123"
+        assert verify_password("securepassword123", hashed) is True
+        assert verify_password("wrongpassword123", hashed) is False
+
+    def test_hash_password_uses_configured_rounds(self, monkeypatch):
+        """BCRYPT_ROUNDS 설정값이 해시 cost로 사용되는지 확인"""
+        monkeypatch.setattr(auth.settings, "BCRYPT_ROUNDS", 5)
+
+        hashed = hash_password("securepassword123")
+
+        assert hashed.startswith("$2b$05$")
+        assert verify_password("securepassword123", hashed) is True
+
+
+class TestDecodeAccessToken:
+    """JWT 토큰 디코드 테스트"""
+
+    def test_decode_valid_token(self):
+        """유효한 토큰 디코드"""
+        token = create_access_token(data={"sub": "1"})
+
+        payload = decode_access_token(token)
+
+        assert payload["sub"] == "1"
+        assert "exp" in payload
+
+    def test_token_exp_is_integer_epoch_seconds(self):
+        """exp는 현재 시각 + 만료 시간의 정수 POSIX 초"""
+        before = int(time.time())
+        token = create_access_token(data={"sub": "1"}, expires_delta=timedelta(minutes=5))
+        after = int(time.time())
+
+        exp = decode_access_token(token)["exp"]
+
+        assert isinstance(exp, int)
+        assert before + 300 <= exp <= after + 300
+
+    def test_decode_invalid_token_raises(self):
+        """유효하지 않은 토큰은 JWTError 발생"""
+        with pytest.raises(JWTError):
+            decode_access_token("invalid_token_here")
+
+    def test_decode_expired_token_raises(self):
+        """만료된 토큰은 JWTError 발생 (캐시되지 않음)"""
+        token = create_access_token(data={"sub": "1"}, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(JWTError):
+            decode_access_token(token)
+
+        assert auth._token_cache == {}
+
+    def test_decode_uses_cache_on_repeat(self, monkeypatch):
+        """같은 토큰의 두 번째 디코드는 jwt.decode를 호출하지 않음"""
+        token = create_access_token(data={"sub": "1"})
+        decode_access_token(token)
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("jwt.decode should not be called on cache hit")
+
+        monkeypatch.setattr(auth.jwt, "decode", fail_decode)
+
+        assert decode_access_token(token)["sub"] == "1"
+
+    def test_cached_payload_is_copied(self):
+        """반환된 페이로드를 수정해도 캐시에 영향 없음"""
+        token = create_access_token(data={"sub": "1"})
+
+        decode_access_token(token)["sub"] = "tampered"
+
+        assert decode_access_token(token)["sub"] == "1"
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """캐시 크기가 TOKEN_CACHE_MAXSIZE를 넘지 않음 (LRU 제거)"""
+        monkeypatch.setattr(auth, "TOKEN_CACHE_MAXSIZE", 2)
+        tokens = [create_access_token(data={"sub": str(i)}) for i in range(3)]
+
+        for token in tokens:
+            decode_access_token(token)
+
+        cached_tokens = [key[0] for key in auth._token_cache]
+        assert cached_tokens == tokens[1:]
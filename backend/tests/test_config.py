@@ -0,0 +1,65 @@
+"""
+설정 모듈 테스트
+
+테스트 항목:
+- get_settings() 인스턴스 캐시
+- cache_clear() 후 환경 변수 재로드
+- ENV=prod에서 .env 파일 미로드
+"""
+
+import pytest
+
+from app import config
+from app.config import Settings, get_settings
+
+
+@pytest.fixture
+def fresh_settings():
+    """테스트 전후로 get_settings 캐시를 비우는 픽스처"""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class TestGetSettings:
+    """get_settings 팩토리 테스트"""
+
+    def test_returns_cached_instance(self, fresh_settings):
+        """여러 번 호출해도 같은 인스턴스 반환"""
+        first = get_settings()
+
+        assert isinstance(first, Settings)
+        assert get_settings() is first
+
+    def test_cache_clear_rereads_environment(self, fresh_settings, monkeypatch):
+        """cache_clear 후에는 변경된 환경 변수를 반영"""
+        monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "5")
+        first = get_settings()
+        monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15")
+
+        assert get_settings().ACCESS_TOKEN_EXPIRE_MINUTES == 5
+
+        get_settings.cache_clear()
+
+        assert get_settings() is not first
+        assert get_settings().ACCESS_TOKEN_EXPIRE_MINUTES == 15
+
+    def test_prod_skips_dotenv(self, fresh_settings, monkeypatch):
+        """ENV=prod이면 .env 파일을 읽지 않음"""
+        calls = []
+        monkeypatch.setenv("ENV", "prod")
+        monkeypatch.setattr(config, "load_dotenv", lambda: calls.append(True))
+
+        get_settings()
+
+        assert calls == []
+
+    def test_non_prod_loads_dotenv(self, fresh_settings, monkeypatch):
+        """ENV가 prod가 아니면 .env 파일을 읽음"""
+        calls = []
+        monkeypatch.delenv("ENV", raising=False)
+        monkeypatch.setattr(config, "load_dotenv", lambda: calls.append(True))
+
+        get_settings()
+
+        assert calls == [True]
@@ -10,55 +10,18 @@ Dashboard 기능 관련 API의 전체 플로우를 검증합니다.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 from datetime import datetime, timedelta
+from sqlalchemy import insert
 
-from app.main import app
-from app.database import Base, get_db
-# 모델 임포트 - 테이블 생성을 위해 필요
-from app.models import Example, User, Activity  # noqa: F401
-
-
-# 테스트용 인메모리 SQLite DB 설정
-TEST_DATABASE_URL = "sqlite:///:memory:"
-test_engine = create_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,  # 인메모리 DB에서 동일한 연결 유지
-)
-TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-
-
-def override_get_db():
-    """테스트용 DB 세션 의존성 오버라이드"""
-    db = TestSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-@pytest.fixture(autouse=True)
-def setup_test_db():
-    """각 테스트 전후로 DB 테이블 생성/삭제 및 의존성 오버라이드"""
-    # DB 의존성 오버라이드 설정
-    app.dependency_overrides[get_db] = override_get_db
-    # 테이블 생성
-    Base.metadata.create_all(bind=test_engine)
-    yield
-    # 테이블 삭제
-    Base.metadata.drop_all(bind=test_engine)
-    # 의존성 오버라이드 해제
-    app.dependency_overrides.clear()
+from app.crud.activity import activity_exists, create_activities, create_activity
+from app.crud.user import create_user
+from app.models.activity import Activity
+from app.models.user import User
+from app.utils.auth import create_access_token, hash_password
 
 
-@pytest.fixture
-def client():
-    """테스트용 HTTP 클라이언트 픽스처"""
-    return TestClient(app)
+# 각 테스트는 conftest의 override_get_db로 롤백되는 트랜잭션 안에서 실행
+pytestmark = pytest.mark.usefixtures("override_get_db")
 
 
 # 테스트에 사용할 유효한 사용자 데이터
@@ -75,12 +38,50 @@ USER2_DATA = {
 }
 
 
+@pytest.fixture(scope="session")
+def password_hash() -> str:
+    """
+    테스트 사용자 비밀번호 해시 픽스처
+
+    대시보드 테스트는 회원가입/로그인을 검증하지 않고 토큰을 직접 발급하므로,
+    bcrypt 해싱은 세션당 한 번만 수행하고 모든 테스트 사용자에 재사용합니다.
+    """
+    return hash_password(USER1_DATA["password"])
+
+
+def create_test_user(db, user_data: dict, password_hash: str) -> User:
+    """사용자를 API를 거치지 않고 DB에 직접 생성하는 헬퍼"""
+    return create_user(
+        db=db,
+        username=user_data["username"],
+        email=user_data["email"],
+        password_hash=password_hash,
+    )
+
+
+def assert_subset(data: dict, expected: dict) -> None:
+    """응답 딕셔너리에서 expected의 키만 골라 한 번에 비교하는 헬퍼"""
+    assert {key: data.get(key) for key in expected} == expected
+
+
+def seed_activities(db, user_id: int, action_types: list) -> None:
+    """조회 테스트용 활동을 단일 executemany INSERT로 생성하는 헬퍼"""
+    create_activities(db, [
+        {"user_id": user_id, "action_type": action_type}
+        for action_type in action_types
+    ])
+
+
+@pytest.fixture
+def auth_user(db, password_hash) -> User:
+    """인증에 사용할 첫 번째 사용자 픽스처"""
+    return create_test_user(db, USER1_DATA, password_hash)
+
+
 @pytest.fixture
-def auth_token(client):
-    """인증된 사용자의 JWT 토큰을 반환하는 픽스처"""
-    # 회원가입
-    response = client.post("/api/auth/register", json=USER1_DATA)
-    return response.json()["access_token"]
+def auth_token(auth_user):
+    """인증된 사용자의 JWT 토큰을 반환하는 픽스처 (회원가입과 동일한 형식)"""
+    return create_access_token(data={"sub": str(auth_user.id)})
 
 
 @pytest.fixture
@@ -90,10 +91,15 @@ def auth_headers(auth_token):
 
 
 @pytest.fixture
-def second_user_auth_token(client):
+def second_user(db, password_hash) -> User:
+    """두 번째 사용자 픽스처"""
+    return create_test_user(db, USER2_DATA, password_hash)
+
+
+@pytest.fixture
+def second_user_auth_token(second_user):
     """두 번째 사용자의 JWT 토큰을 반환하는 픽스처"""
-    response = client.post("/api/auth/register", json=USER2_DATA)
-    return response.json()["access_token"]
+    return create_access_token(data={"sub": str(second_user.id)})
 
 
 @pytest.fixture
@@ -130,27 +136,8 @@ class TestCreateActivityEndpoint:
 
         assert response.status_code == 201
         data = response.json()
-        assert "id" in data
-        assert data["action_type"] == VALID_ACTIVITY_DATA["action_type"]
-        assert data["description"] == VALID_ACTIVITY_DATA["description"]
-        assert data["extra_data"] == VALID_ACTIVITY_DATA["extra_data"]
-        assert "user_id" in data
-        assert "created_at" in data
-
-    def test_create_activity_without_auth_failure(self, client):
-        """
-        인증 없이 활동 생성 실패 테스트
-
-        - Authorization 헤더 없이 POST /api/dashboard/activities
-        - 401 Unauthorized 또는 403 Forbidden 확인
-        """
-        response = client.post(
-            "/api/dashboard/activities",
-            json=VALID_ACTIVITY_DATA
-        )
-
-        # HTTPBearer는 Authorization 헤더가 없으면 403 Forbidden 반환
-        assert response.status_code in [401, 403]
+        assert {"id", "user_id", "created_at"} <= data.keys()
+        assert_subset(data, VALID_ACTIVITY_DATA)
 
     def test_create_activity_missing_action_type_failure(self, client, auth_headers):
         """
@@ -190,9 +177,7 @@ class TestCreateActivityEndpoint:
         assert response.status_code == 201
         data = response.json()
         assert isinstance(data["extra_data"], dict)
-        assert data["extra_data"]["page"] == "/dashboard"
-        assert data["extra_data"]["duration"] == 120
-        assert data["extra_data"]["scroll_depth"] == 0.8
+        assert data["extra_data"] == activity_data["extra_data"]
 
     def test_create_activity_without_optional_fields(self, client, auth_headers):
         """
@@ -210,9 +195,7 @@ class TestCreateActivityEndpoint:
 
         assert response.status_code == 201
         data = response.json()
-        assert data["action_type"] == "click"
-        assert data["description"] is None
-        assert data["extra_data"] is None
+        assert_subset(data, {"action_type": "click", "description": None, "extra_data": None})
 
 
 class TestGetActivitiesEndpoint:
@@ -235,7 +218,7 @@ class TestGetActivitiesEndpoint:
         data = response.json()
         assert isinstance(data, list)
 
-    def test_get_activities_pagination(self, client, auth_headers):
+    def test_get_activities_pagination(self, client, db, auth_user, auth_headers):
         """
         페이지네이션 동작 테스트 (limit, offset)
 
@@ -243,12 +226,7 @@ class TestGetActivitiesEndpoint:
         - 올바른 개수가 반환되는지 확인
         """
         # 10개 활동 생성
-        for i in range(10):
-            client.post(
-                "/api/dashboard/activities",
-                json={"action_type": f"action_{i}"},
-                headers=auth_headers
-            )
+        seed_activities(db, auth_user.id, [f"action_{i}" for i in range(10)])
 
         # limit=5로 조회
         response = client.get(
@@ -277,30 +255,67 @@ class TestGetActivitiesEndpoint:
         data = response.json()
         assert len(data) == 2
 
-    def test_get_activities_sorted_by_latest(self, client, auth_headers):
+    def test_get_activities_cursor_pagination(self, client, auth_headers):
         """
-        최신순 정렬 확인 테스트
+        커서(keyset) 페이지네이션 동작 테스트
 
-        - 여러 활동 생성 후 조회
-        - created_at 기준 내림차순 정렬 확인
+        - limit개가 반환되면 X-Next-Cursor 헤더로 다음 페이지 커서 제공
+        - 커서로 조회 시 중복 없이 이어지는 활동 반환
+        - 마지막 페이지에서는 X-Next-Cursor 헤더 없음
         """
-        # 활동 생성
-        client.post(
-            "/api/dashboard/activities",
-            json={"action_type": "first_action"},
-            headers=auth_headers
-        )
-        client.post(
-            "/api/dashboard/activities",
-            json={"action_type": "second_action"},
-            headers=auth_headers
-        )
-        client.post(
-            "/api/dashboard/activities",
-            json={"action_type": "third_action"},
+        for i in range(5):
+            client.post(
+                "/api/dashboard/activities",
+                json={"action_type": f"action_{i}"},
+                headers=auth_headers
+            )
+
+        seen = []
+        cursor = None
+        for _ in range(3):
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get(
+                "/api/dashboard/activities", params=params, headers=auth_headers
+            )
+            assert response.status_code == 200
+            seen.extend(item["action_type"] for item in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+
+        assert seen == [f"action_{i}" for i in range(4, -1, -1)]
+        assert cursor is None
+
+    def test_get_activities_invalid_cursor_failure(self, client, auth_headers):
+        """
+        잘못된 커서로 조회 시 400 Bad Request 확인
+        """
+        response = client.get(
+            "/api/dashboard/activities?cursor=not-a-cursor",
             headers=auth_headers
         )
 
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    def test_get_activities_sorted_by_latest(self, client, db, auth_user, auth_headers):
+        """
+        최신순 정렬 확인 테스트
+
+        - created_at이 1초씩 다른 활동을 id 순서와 다르게 생성 후 조회
+        - created_at 기준 내림차순 정렬 확인
+        """
+        # 활동 생성 (시계 해상도에 의존하지 않도록 created_at을 명시)
+        base_time = datetime(2024, 1, 1, 0, 0, 0)
+        db.execute(insert(Activity), [
+            {"user_id": auth_user.id, "action_type": action_type,
+             "created_at": base_time + timedelta(seconds=offset)}
+            for action_type, offset in [
+                ("second_action", 1), ("third_action", 2), ("first_action", 0)
+            ]
+        ])
+        db.commit()
+
         response = client.get(
             "/api/dashboard/activities",
             headers=auth_headers
@@ -314,16 +329,6 @@ class TestGetActivitiesEndpoint:
         assert data[1]["action_type"] == "second_action"
         assert data[2]["action_type"] == "first_action"
 
-    def test_get_activities_without_auth_failure(self, client):
-        """
-        인증 없이 활동 목록 조회 실패 테스트
-
-        - Authorization 헤더 없이 GET /api/dashboard/activities
-        - 401 또는 403 확인
-        """
-        response = client.get("/api/dashboard/activities")
-        assert response.status_code in [401, 403]
-
     def test_get_activities_does_not_show_other_users_activities(
         self, client, auth_headers, second_user_auth_headers
     ):
@@ -428,26 +433,6 @@ class TestGetActivityDetailEndpoint:
         data = response.json()
         assert data["detail"] == "Not authorized to access this activity"
 
-    def test_get_activity_detail_without_auth_failure(self, client, auth_headers):
-        """
-        인증 없이 활동 상세 조회 실패 테스트
-
-        - Authorization 헤더 없이 GET /api/dashboard/activities/{id}
-        - 401 또는 403 확인
-        """
-        # 먼저 활동 생성
-        create_response = client.post(
-            "/api/dashboard/activities",
-            json={"action_type": "test_action"},
-            headers=auth_headers
-        )
-        activity_id = create_response.json()["id"]
-
-        # 인증 없이 조회 시도
-        response = client.get(f"/api/dashboard/activities/{activity_id}")
-
-        assert response.status_code in [401, 403]
-
 
 class TestGetActivityStatsEndpoint:
     """GET /api/dashboard/stats 엔드포인트 테스트"""
@@ -486,16 +471,14 @@ class TestGetActivityStatsEndpoint:
         data = response.json()
 
         # 필수 필드 확인
-        assert "total_count" in data
-        assert "by_type" in data
-        assert "by_date" in data
-        assert "most_common_action" in data
+        assert {"total_count", "by_type", "by_date", "most_common_action"} <= data.keys()
 
         # 값 확인
-        assert data["total_count"] == 3
-        assert data["by_type"]["login"] == 2
-        assert data["by_type"]["click"] == 1
-        assert data["most_common_action"] == "login"
+        assert_subset(data, {
+            "total_count": 3,
+            "by_type": {"login": 2, "click": 1},
+            "most_common_action": "login",
+        })
 
     def test_get_activity_stats_date_filtering(self, client, auth_headers):
         """
@@ -544,17 +527,6 @@ class TestGetActivityStatsEndpoint:
         assert data["by_date"] == {}
         assert data["most_common_action"] is None
 
-    def test_get_activity_stats_without_auth_failure(self, client):
-        """
-        인증 없이 통계 조회 실패 테스트
-
-        - Authorization 헤더 없이 GET /api/dashboard/stats
-        - 401 또는 403 확인
-        """
-        response = client.get("/api/dashboard/stats")
-
-        assert response.status_code in [401, 403]
-
 
 class TestDeleteActivityEndpoint:
     """DELETE /api/dashboard/activities/{activity_id} 엔드포인트 테스트"""
@@ -626,26 +598,6 @@ class TestDeleteActivityEndpoint:
         data = response.json()
         assert data["detail"] == "Not authorized to delete this activity"
 
-    def test_delete_activity_without_auth_failure(self, client, auth_headers):
-        """
-        인증 없이 활동 삭제 실패 테스트
-
-        - Authorization 헤더 없이 DELETE /api/dashboard/activities/{id}
-        - 401 또는 403 확인
-        """
-        # 먼저 활동 생성
-        create_response = client.post(
-            "/api/dashboard/activities",
-            json={"action_type": "test_action"},
-            headers=auth_headers
-        )
-        activity_id = create_response.json()["id"]
-
-        # 인증 없이 삭제 시도
-        response = client.delete(f"/api/dashboard/activities/{activity_id}")
-
-        assert response.status_code in [401, 403]
-
     def test_delete_activity_then_get_returns_404(self, client, auth_headers):
         """
         삭제 후 조회 시 404 확인 테스트
@@ -676,6 +628,46 @@ class TestDeleteActivityEndpoint:
         assert get_response.status_code == 404
 
 
+class TestDashboardAuthRequired:
+    """인증 없이 Dashboard API 접근 실패 테스트"""
+
+    @pytest.mark.parametrize(
+        "method, path, request_kwargs",
+        [
+            pytest.param(
+                "post", "/api/dashboard/activities", {"json": VALID_ACTIVITY_DATA},
+                id="create_activity",
+            ),
+            pytest.param("get", "/api/dashboard/activities", {}, id="list_activities"),
+            pytest.param(
+                "get", "/api/dashboard/activities/{activity_id}", {}, id="activity_detail",
+            ),
+            pytest.param("get", "/api/dashboard/stats", {}, id="stats"),
+            pytest.param(
+                "delete", "/api/dashboard/activities/{activity_id}", {}, id="delete_activity",
+            ),
+        ],
+    )
+    def test_endpoint_without_auth_failure(
+        self, client, db, auth_user, method, path, request_kwargs
+    ):
+        """
+        인증 없이 Dashboard API 접근 실패 테스트
+
+        - Authorization 헤더 없이 각 엔드포인트 호출
+        - 활동 ID가 필요한 경로는 DB에 직접 생성한 활동 사용
+        - 401 Unauthorized 또는 403 Forbidden 확인
+        """
+        activity = create_activity(db, auth_user.id, "test_action")
+
+        response = getattr(client, method)(
+            path.format(activity_id=activity.id), **request_kwargs
+        )
+
+        # HTTPBearer는 Authorization 헤더가 없으면 403 Forbidden 반환
+        assert response.status_code in [401, 403]
+
+
 class TestDashboardIntegrationFlow:
     """Dashboard API 통합 플로우 테스트"""
 
@@ -720,12 +712,11 @@ class TestDashboardIntegrationFlow:
         )
         assert stats_response.status_code == 200
         stats = stats_response.json()
-        assert stats["total_count"] == 5
-        assert stats["by_type"]["login"] == 2
-        assert stats["by_type"]["page_view"] == 1
-        assert stats["by_type"]["click"] == 1
-        assert stats["by_type"]["logout"] == 1
-        assert stats["most_common_action"] == "login"
+        assert_subset(stats, {
+            "total_count": 5,
+            "by_type": {"login": 2, "page_view": 1, "click": 1, "logout": 1},
+            "most_common_action": "login",
+        })
 
         # 4. 하나 삭제
         delete_response = client.delete(
@@ -748,7 +739,7 @@ class TestDashboardIntegrationFlow:
         assert created_ids[0] not in remaining_ids
 
     def test_multi_user_activity_isolation(
-        self, client, auth_headers, second_user_auth_headers
+        self, client, db, auth_headers, second_user_auth_headers
     ):
         """
         다른 사용자의 활동 접근 불가 테스트
@@ -809,16 +800,11 @@ class TestDashboardIntegrationFlow:
             assert delete_response.status_code == 403
             assert delete_response.json()["detail"] == "Not authorized to delete this activity"
 
-        # user1의 활동은 여전히 존재해야 함
-        user1_list_response = client.get(
-            "/api/dashboard/activities",
-            headers=auth_headers
-        )
-        assert user1_list_response.status_code == 200
-        assert len(user1_list_response.json()) == 2
+        # user1의 활동은 여전히 존재해야 함 (목록 API는 위에서 검증했으므로 DB 직접 확인)
+        assert all(activity_exists(db, activity_id) for activity_id in user1_activity_ids)
 
     def test_stats_only_include_own_activities(
-        self, client, auth_headers, second_user_auth_headers
+        self, client, db, auth_user, auth_headers, second_user, second_user_auth_headers
     ):
         """
         통계가 본인의 활동만 포함하는지 테스트
@@ -827,20 +813,10 @@ class TestDashboardIntegrationFlow:
         - 각 사용자의 통계에 본인 활동만 포함 확인
         """
         # user1이 활동 3개 생성
-        for i in range(3):
-            client.post(
-                "/api/dashboard/activities",
-                json={"action_type": "user1_type"},
-                headers=auth_headers
-            )
+        seed_activities(db, auth_user.id, ["user1_type"] * 3)
 
         # user2가 활동 2개 생성
-        for i in range(2):
-            client.post(
-                "/api/dashboard/activities",
-                json={"action_type": "user2_type"},
-                headers=second_user_auth_headers
-            )
+        seed_activities(db, second_user.id, ["user2_type"] * 2)
 
         # user1의 통계 확인
         user1_stats = client.get(
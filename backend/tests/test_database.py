@@ -0,0 +1,40 @@
+"""
+데이터베이스 엔진 설정 테스트
+
+테스트 항목:
+- 파일 기반 SQLite에서 연결 풀 크기 설정
+- 인메모리 SQLite에서 풀 크기 설정 생략
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool, SingletonThreadPool
+
+from app.config import settings
+from app.database import create_db_engine
+
+
+class TestCreateDbEngine:
+    """create_db_engine 함수 테스트"""
+
+    def test_file_sqlite_uses_configured_queue_pool(self, tmp_path):
+        """파일 기반 SQLite는 설정된 크기의 QueuePool 사용"""
+        engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+
+        try:
+            assert isinstance(engine.pool, QueuePool)
+            assert engine.pool.size() == settings.DB_POOL_SIZE
+        finally:
+            engine.dispose()
+
+    @pytest.mark.parametrize("url", ["sqlite://", "sqlite:///:memory:"])
+    def test_in_memory_sqlite_skips_pool_sizing(self, url):
+        """인메모리 SQLite는 풀 크기 인자 없이 엔진 생성 및 연결 가능"""
+        engine = create_db_engine(url)
+
+        try:
+            assert isinstance(engine.pool, SingletonThreadPool)
+            with engine.connect() as conn:
+                assert conn.execute(text("SELECT 1")).scalar() == 1
+        finally:
+            engine.dispose()
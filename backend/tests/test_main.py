@@ -4,17 +4,34 @@ FastAPI 앱 테스트
 FastAPI 애플리케이션의 초기화, 메타데이터, 미들웨어 설정을 테스트합니다.
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app import main
+from app.dependencies import get_current_user
+from app.dependencies.auth import get_current_user as auth_get_current_user
 from app.main import app
 
 
-@pytest.fixture
-def client():
-    """테스트용 HTTP 클라이언트 픽스처"""
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def route_paths() -> list:
+    """앱에 등록된 라우트 경로 목록 (모듈당 한 번만 계산)"""
+    return [route.path for route in app.routes]
+
+
+@pytest.fixture(scope="module")
+def preflight_response(client):
+    """허용된 origin(localhost:3000)의 CORS preflight 응답 (모듈당 한 번만 요청)"""
+    return client.options(
+        "/api/health",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "GET",
+        }
+    )
 
 
 class TestAppInitialization:
@@ -26,10 +43,37 @@ class TestAppInitialization:
 
     def test_app_is_fastapi_instance(self):
         """앱이 FastAPI 인스턴스인지 확인"""
-        from fastapi import FastAPI
         assert isinstance(app, FastAPI)
 
 
+class TestAppLifespan:
+    """앱 시작/종료 처리 테스트"""
+
+    def test_tables_created_on_startup_not_import(self, monkeypatch):
+        """테이블 생성은 임포트 시점이 아닌 lifespan 시작 시 수행"""
+        calls = []
+        monkeypatch.setattr(
+            main.Base.metadata, "create_all", lambda bind: calls.append("create_all")
+        )
+
+        class FakeBuffer:
+            def start(self):
+                calls.append("start")
+
+            def stop(self):
+                calls.append("stop")
+
+        monkeypatch.setattr(main, "activity_write_buffer", FakeBuffer())
+
+        async def run_lifespan():
+            async with main.lifespan(app):
+                calls.append("running")
+
+        asyncio.run(run_lifespan())
+
+        assert calls == ["create_all", "start", "running", "stop"]
+
+
 class TestAppMetadata:
     """앱 메타데이터 테스트"""
 
@@ -53,28 +97,14 @@ class TestCORSMiddleware:
         cors_found = any('CORS' in str(m) or 'cors' in str(m).lower() for m in app.user_middleware)
         assert cors_found or len(app.user_middleware) > 0
 
-    def test_cors_allows_localhost_3000(self, client):
+    def test_cors_allows_localhost_3000(self, preflight_response):
         """CORS가 localhost:3000을 허용하는지 확인"""
-        response = client.options(
-            "/api/health",
-            headers={
-                "Origin": "http://localhost:3000",
-                "Access-Control-Request-Method": "GET",
-            }
-        )
         # CORS preflight 응답 확인
-        assert response.headers.get("access-control-allow-origin") == "http://localhost:3000"
+        assert preflight_response.headers.get("access-control-allow-origin") == "http://localhost:3000"
 
-    def test_cors_allows_credentials(self, client):
+    def test_cors_allows_credentials(self, preflight_response):
         """CORS가 credentials를 허용하는지 확인"""
-        response = client.options(
-            "/api/health",
-            headers={
-                "Origin": "http://localhost:3000",
-                "Access-Control-Request-Method": "GET",
-            }
-        )
-        assert response.headers.get("access-control-allow-credentials") == "true"
+        assert preflight_response.headers.get("access-control-allow-credentials") == "true"
 
     def test_cors_blocks_unauthorized_origin(self, client):
         """허용되지 않은 origin은 CORS 헤더가 없는지 확인"""
@@ -93,17 +123,38 @@ class TestCORSMiddleware:
 class TestRouterRegistration:
     """라우터 등록 확인 테스트"""
 
-    def test_examples_router_registered(self):
+    def test_examples_router_registered(self, route_paths):
         """examples 라우터가 등록되어 있는지 확인"""
-        routes = [route.path for route in app.routes]
         # /api/examples 경로가 존재하는지 확인
-        examples_routes = [r for r in routes if r.startswith("/api/examples")]
-        assert len(examples_routes) > 0
+        assert any(path.startswith("/api/examples") for path in route_paths)
 
-    def test_health_endpoint_registered(self):
+    def test_health_endpoint_registered(self, route_paths):
         """health check 엔드포인트가 등록되어 있는지 확인"""
-        routes = [route.path for route in app.routes]
-        assert "/api/health" in routes
+        assert "/api/health" in route_paths
+
+    def test_single_get_current_user_dependency(self):
+        """
+        모든 라우트가 동일한 get_current_user 의존성을 사용하는지 확인
+
+        서로 다른 구현이 섞이면 FastAPI의 요청 단위 의존성 캐시가 동작하지 않아
+        한 요청에서 토큰 디코드와 사용자 조회가 중복됩니다.
+        """
+        assert get_current_user is auth_get_current_user
+
+        def collect_calls(dependant):
+            for dependency in dependant.dependencies:
+                yield dependency.call
+                yield from collect_calls(dependency)
+
+        auth_calls = [
+            call
+            for route in app.routes
+            if hasattr(route, "dependant")
+            for call in collect_calls(route.dependant)
+            if getattr(call, "__name__", None) == "get_current_user"
+        ]
+        assert len(auth_calls) > 0
+        assert all(call is get_current_user for call in auth_calls)
 
     def test_openapi_schema_available(self, client):
         """OpenAPI 스키마가 사용 가능한지 확인"""
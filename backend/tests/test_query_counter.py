@@ -0,0 +1,84 @@
+"""
+요청별 SQL 쿼리 카운트 미들웨어 테스트
+
+테스트 항목:
+- 동기 엔드포인트에서 실행한 쿼리 수가 X-Query-Count 헤더로 노출되는지
+- 임계값 초과 시 경고 로그 출력
+- 요청 밖에서 실행된 쿼리는 집계되지 않음
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.utils.query_counter import QUERY_COUNT_HEADER, install_query_counter
+
+
+@pytest.fixture
+def engine():
+    """테스트용 인메모리 SQLite 엔진"""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    """쿼리 카운터가 설치된 테스트 앱 클라이언트"""
+    app = FastAPI()
+    install_query_counter(app, threshold=2)
+
+    @app.get("/queries/{count}")
+    def run_queries(count: int):
+        with engine.connect() as conn:
+            for _ in range(count):
+                conn.execute(text("SELECT 1"))
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+class TestQueryCounterMiddleware:
+    """쿼리 카운트 미들웨어 테스트"""
+
+    def test_query_count_header(self, client):
+        """실행한 쿼리 수가 응답 헤더에 포함됨"""
+        response = client.get("/queries/2")
+
+        assert response.status_code == 200
+        assert response.headers[QUERY_COUNT_HEADER] == "2"
+
+    def test_query_count_is_per_request(self, client):
+        """요청마다 카운트가 초기화됨"""
+        client.get("/queries/2")
+        response = client.get("/queries/1")
+
+        assert response.headers[QUERY_COUNT_HEADER] == "1"
+
+    def test_warns_when_threshold_exceeded(self, client, caplog):
+        """임계값을 넘으면 경고 로그 출력"""
+        with caplog.at_level(logging.WARNING, logger="app.utils.query_counter"):
+            client.get("/queries/1")
+            assert caplog.records == []
+
+            client.get("/queries/3")
+
+        assert len(caplog.records) == 1
+        assert "/queries/3 executed 3 queries" in caplog.records[0].getMessage()
+
+    def test_queries_outside_request_not_counted(self, client, engine):
+        """요청 밖에서 실행된 쿼리는 집계되지 않음"""
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        response = client.get("/queries/0")
+
+        assert response.headers[QUERY_COUNT_HEADER] == "0"
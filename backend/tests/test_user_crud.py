@@ -5,19 +5,65 @@ User CRUD 함수 테스트
 - 사용자 생성 및 필드 검증
 - 중복 email/username 시 IntegrityError 발생
 - email/username/id로 사용자 조회
+- email 또는 username 일치 사용자 단일 쿼리 조회
+- get_user_auth_stub 인증용 컬럼 조회 및 Redis 캐시 (cache-aside) 동작
 """
 
 import pytest
+import redis
 from sqlalchemy.exc import IntegrityError
 
+from app import cache
 from app.crud.user import (
     create_user,
     get_user_by_email,
     get_user_by_username,
+    get_users_by_email_or_username,
     get_user_by_id,
+    get_user_auth_stub,
+    invalidate_user_cache,
 )
 
 
+class FakeRedis:
+    """테스트용 인메모리 Redis 대체 객체 (get/setex/delete만 지원)"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+class BrokenRedis:
+    """모든 호출에서 연결 오류를 발생시키는 Redis 대체 객체"""
+
+    def get(self, key):
+        raise redis.ConnectionError("redis down")
+
+    def setex(self, key, ttl, value):
+        raise redis.ConnectionError("redis down")
+
+    def delete(self, key):
+        raise redis.ConnectionError("redis down")
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Redis 클라이언트를 FakeRedis로 교체하는 픽스처"""
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "redis_client", client)
+    return client
+
+
 class TestCreateUser:
     """사용자 생성 테스트"""
 
@@ -132,6 +178,45 @@ class TestGetUserByUsername:
         assert result is None
 
 
+class TestGetUsersByEmailOrUsername:
+    """email 또는 username 일치 사용자 조회 테스트"""
+
+    def test_returns_users_matching_either_field(self, db):
+        """email 일치 사용자와 username 일치 사용자를 모두 반환"""
+        by_email = create_user(
+            db=db,
+            username="first",
+            email="taken@example.com",
+            password_hash="hash",
+        )
+        by_username = create_user(
+            db=db,
+            username="taken",
+            email="second@example.com",
+            password_hash="hash",
+        )
+        create_user(
+            db=db,
+            username="other",
+            email="other@example.com",
+            password_hash="hash",
+        )
+
+        result = get_users_by_email_or_username(
+            db, email="taken@example.com", username="taken"
+        )
+
+        assert {user.id for user in result} == {by_email.id, by_username.id}
+
+    def test_returns_empty_list_when_no_match(self, db):
+        """일치하는 사용자가 없으면 빈 리스트 반환"""
+        result = get_users_by_email_or_username(
+            db, email="none@example.com", username="none"
+        )
+
+        assert result == []
+
+
 class TestGetUserById:
     """ID로 사용자 조회 테스트"""
 
@@ -158,3 +243,82 @@ class TestGetUserById:
         result = get_user_by_id(db, 99999)
 
         assert result is None
+
+
+class TestGetUserAuthStub:
+    """get_user_auth_stub (인증용 컬럼 조회 + Redis 캐시) 테스트"""
+
+    def test_auth_stub_excludes_password_hash(self, db):
+        """인증용 사용자는 password_hash 없이 반환"""
+        user = create_user(db, "stubuser", "stub@example.com", "hash")
+
+        stub = get_user_auth_stub(db, user.id)
+
+        assert stub is not user
+        assert stub.id == user.id
+        assert stub.username == "stubuser"
+        assert stub.email == "stub@example.com"
+        assert stub.created_at == user.created_at
+        assert stub.password_hash is None
+
+    def test_auth_stub_not_exists(self, db):
+        """존재하지 않는 ID로 조회 시 None 반환"""
+        assert get_user_auth_stub(db, 99999) is None
+
+    def test_cache_miss_populates_cache(self, db, fake_redis):
+        """캐시 미스 시 DB 조회 결과를 TTL과 함께 캐시에 저장"""
+        user = create_user(db, "cacheuser", "cache@example.com", "hash")
+
+        found_user = get_user_auth_stub(db, user.id)
+
+        assert found_user.id == user.id
+        assert f"user:{user.id}" in fake_redis.store
+        assert fake_redis.ttls[f"user:{user.id}"] == 60
+        assert "hash" not in fake_redis.store[f"user:{user.id}"]
+
+    def test_cache_hit_skips_db(self, db, fake_redis):
+        """캐시 히트 시 DB에서 사라진 사용자도 캐시에서 반환"""
+        user = create_user(db, "hituser", "hit@example.com", "hash")
+        user_id = user.id
+        created_at = user.created_at
+        get_user_auth_stub(db, user_id)
+
+        db.delete(user)
+        db.commit()
+
+        cached_user = get_user_auth_stub(db, user_id)
+
+        assert cached_user is not None
+        assert cached_user.id == user_id
+        assert cached_user.username == "hituser"
+        assert cached_user.email == "hit@example.com"
+        assert cached_user.created_at == created_at
+        assert cached_user.password_hash is None
+
+    def test_invalidate_user_cache(self, db, fake_redis):
+        """무효화 후에는 다시 DB에서 조회"""
+        user = create_user(db, "invuser", "inv@example.com", "hash")
+        user_id = user.id
+        get_user_auth_stub(db, user_id)
+
+        db.delete(user)
+        db.commit()
+        invalidate_user_cache(user_id)
+
+        assert get_user_auth_stub(db, user_id) is None
+
+    def test_not_found_is_not_cached(self, db, fake_redis):
+        """존재하지 않는 사용자는 캐시하지 않음"""
+        assert get_user_auth_stub(db, 99999) is None
+        assert fake_redis.store == {}
+
+    def test_redis_error_falls_back_to_db(self, db, monkeypatch):
+        """Redis 오류 시 DB 조회로 대체"""
+        monkeypatch.setattr(cache, "redis_client", BrokenRedis())
+        user = create_user(db, "downuser", "down@example.com", "hash")
+
+        found_user = get_user_auth_stub(db, user.id)
+
+        assert found_user is not None
+        assert found_user.id == user.id
+        invalidate_user_cache(user.id)
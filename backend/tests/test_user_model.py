@@ -5,12 +5,18 @@ User 모델의 필드 검증, 타임스탬프 자동 생성, unique 제약 조
 """
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timezone
 
 from app.models.user import User
 
 
+def _naive(dt: datetime) -> datetime:
+    """SQLite는 timezone 정보를 저장하지 않으므로 naive datetime으로 맞춰 비교"""
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
 class TestUserModelFields:
     """User 모델 필드 검증 테스트"""
 
@@ -23,7 +29,6 @@ class TestUserModelFields:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
 
         # 모든 필드가 존재하는지 확인
         assert hasattr(user, "id")
@@ -42,7 +47,6 @@ class TestUserModelFields:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
 
         assert user.username == "fieldtest"
         assert user.email == "field@example.com"
@@ -77,7 +81,6 @@ class TestUserModelFields:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
 
         repr_str = repr(user)
         assert "reprtest" in repr_str
@@ -99,19 +102,10 @@ class TestUserTimestamps:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
-
-        after_create = datetime.now(timezone.utc)
 
         assert user.created_at is not None
-        # 타임스탬프가 적절한 범위 내에 있는지 확인 (timezone 차이 고려)
-        # SQLite는 timezone 정보를 저장하지 않으므로 naive datetime으로 비교
-        created_at_naive = user.created_at.replace(tzinfo=None) if user.created_at.tzinfo else user.created_at
-        before_naive = before_create.replace(tzinfo=None)
-        after_naive = after_create.replace(tzinfo=None)
-
-        # 1분 이내의 차이 허용
-        assert abs((created_at_naive - before_naive).total_seconds()) < 60
+        # 타임스탬프가 적절한 범위 내에 있는지 확인 (1분 이내의 차이 허용)
+        assert abs((_naive(user.created_at) - _naive(before_create)).total_seconds()) < 60
 
     def test_updated_at_auto_generated(self, db):
         """updated_at이 자동으로 생성되는지 확인"""
@@ -122,7 +116,6 @@ class TestUserTimestamps:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
 
         assert user.updated_at is not None
 
@@ -135,7 +128,6 @@ class TestUserTimestamps:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
 
         # 초 단위로 비교 (밀리초 차이 허용)
         created_ts = user.created_at.replace(microsecond=0)
@@ -145,44 +137,59 @@ class TestUserTimestamps:
         assert abs((created_ts - updated_ts).total_seconds()) <= 1
 
 
-class TestUserUniqueConstraints:
-    """unique 제약 조건 테스트"""
+    def test_timestamps_loaded_by_insert_returning(self, db):
+        """created_at/updated_at은 INSERT ... RETURNING으로 채워져 추가 SELECT 없음"""
+        statements = []
+
+        def count_statements(conn, cursor, statement, parameters, context, executemany):
+            # 테스트 픽스처의 SAVEPOINT 관리 구문은 제외
+            if "SAVEPOINT" not in statement:
+                statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statements)
+        try:
+            user = User(
+                username="returning_user",
+                email="returning@example.com",
+                password_hash="hash"
+            )
+            db.add(user)
+            db.commit()
+            values = (user.id, user.created_at, user.updated_at)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statements)
 
-    def test_duplicate_username_raises_error(self, db):
-        """중복 username 삽입 시 IntegrityError 발생 확인"""
-        user1 = User(
-            username="duplicate_name",
-            email="unique1@example.com",
-            password_hash="hash1"
-        )
-        db.add(user1)
-        db.commit()
+        assert all(value is not None for value in values)
+        assert len(statements) == 1
+        assert "RETURNING" in statements[0].upper()
 
-        user2 = User(
-            username="duplicate_name",  # 중복 username
-            email="unique2@example.com",
-            password_hash="hash2"
-        )
-        db.add(user2)
 
-        with pytest.raises(IntegrityError):
-            db.commit()
+class TestUserUniqueConstraints:
+    """unique 제약 조건 테스트"""
 
-    def test_duplicate_email_raises_error(self, db):
-        """중복 email 삽입 시 IntegrityError 발생 확인"""
-        user1 = User(
-            username="unique1",
-            email="duplicate@example.com",
-            password_hash="hash1"
-        )
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            pytest.param(
+                {"username": "duplicate_name", "email": "unique1@example.com"},
+                {"username": "duplicate_name", "email": "unique2@example.com"},  # 중복 username
+                id="username",
+            ),
+            pytest.param(
+                {"username": "unique1", "email": "duplicate@example.com"},
+                {"username": "unique2", "email": "duplicate@example.com"},  # 중복 email
+                id="email",
+            ),
+        ],
+    )
+    def test_duplicate_raises_error(self, db, first, second):
+        """중복 username/email 삽입 시 IntegrityError 발생 확인"""
+        user1 = User(**first, password_hash="hash1")
         db.add(user1)
         db.commit()
 
-        user2 = User(
-            username="unique2",
-            email="duplicate@example.com",  # 중복 email
-            password_hash="hash2"
-        )
+        user2 = User(**second, password_hash="hash2")
         db.add(user2)
 
         with pytest.raises(IntegrityError):